@@ -14,30 +14,58 @@ Usage:
     python cli.py store-retry --help
 """
 
+# Heavier stdlib modules (asyncio, concurrent.futures, csv) are imported
+# inside the commands that use them so that e.g. `transform` does not pay
+# for the scrapers' imports.
 import argparse
-import asyncio
-import concurrent.futures
-import csv
-import json
-import multiprocessing as mp
+import contextlib
 import os
-import subprocess
+import shutil
+import string
 import sys
+import tempfile
 import time
-from typing import Any, Optional, Protocol, cast, runtime_checkable
-
+from dataclasses import dataclass
+from operator import itemgetter
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Self,
+    cast,
+)
+
+from .core.fields import ALL_FIELDS
+from .utils import json_io
 from .utils.logger import ScraperLogger
 
+if TYPE_CHECKING:
+    import asyncio
+    import concurrent.futures
+
+# Output directory shared with core.scraper.RESULTS_DIR; the prefix form
+# lets per-file paths be built by concatenation
+_RESULTS_DIR = "results"
+_RESULTS_PREFIX = _RESULTS_DIR + os.sep
+
+# Loggers for helpers that run once per query or per file
+_query_logger = ScraperLogger("CLI.QueryReader")
+_task_logger = ScraperLogger("CLI.MultiScraper")
+_merge_logger = ScraperLogger("CLI.Merge")
+
 
-@runtime_checkable
-class MultiScraperArgset(Protocol):
-    """Structural type for multi-query scraper args used by run_single_scraper.
+@dataclass(frozen=True, slots=True)
+class ScraperArgs:
+    """Multi-query scraper settings shared by every run_single_scraper task.
 
-    This mirrors the attributes accessed on argparse.Namespace in multi mode,
-    enabling precise type checking without tying to argparse directly.
+    Built once from the argparse.Namespace in multi mode; frozen so the worker
+    threads can share one instance safely.
     """
 
-    # Common
     brand: str
     pages: int
     discount: bool
@@ -45,7 +73,7 @@ class MultiScraperArgset(Protocol):
     min_price: Optional[float]
     max_price: Optional[float]
     delay: float
-    fields: list[str]
+    fields: tuple[str, ...]
     proxy_provider: str
     enable_store_retry: bool
     store_retry_batch_size: int
@@ -54,6 +82,26 @@ class MultiScraperArgset(Protocol):
     scraper_type: str
 
 
+def _event_loop_factory() -> Optional[Callable[[], "asyncio.AbstractEventLoop"]]:
+    """Return uvloop's loop factory when available, else None (default loop)"""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def _page_count(value: str) -> int:
+    """argparse type for --pages: an integer between 1 and 60"""
+    try:
+        pages = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'") from None
+    if not 1 <= pages <= 60:
+        raise argparse.ArgumentTypeError(f"{pages} is not in range 1-60")
+    return pages
+
+
 def create_basic_scraper_parser(subparsers: Any) -> None:
     """Create parser for basic scraper functionality"""
     parser = subparsers.add_parser(
@@ -74,9 +122,8 @@ def create_basic_scraper_parser(subparsers: Any) -> None:
     parser.add_argument(
         "--pages",
         "-p",
-        type=int,
+        type=_page_count,
         default=1,
-        choices=range(1, 61),
         metavar="[1-60]",
         help="Number of pages to scrape (default: 1, max: 60)",
     )
@@ -97,38 +144,8 @@ def create_basic_scraper_parser(subparsers: Any) -> None:
     parser.add_argument(
         "--fields",
         nargs="+",
-        choices=[
-            "Product ID",
-            "Title",
-            "Sale Price",
-            "Original Price",
-            "Discount (%)",
-            "Currency",
-            "Rating",
-            "Orders Count",
-            "Store Name",
-            "Store ID",
-            "Store URL",
-            "Product URL",
-            "Image URL",
-            "Brand",
-        ],
-        default=[
-            "Product ID",
-            "Title",
-            "Sale Price",
-            "Original Price",
-            "Discount (%)",
-            "Currency",
-            "Rating",
-            "Orders Count",
-            "Store Name",
-            "Store ID",
-            "Store URL",
-            "Product URL",
-            "Image URL",
-            "Brand",
-        ],
+        choices=ALL_FIELDS,
+        default=list(ALL_FIELDS),
         help="Fields to extract (default: all fields)",
     )
     parser.add_argument(
@@ -274,9 +291,8 @@ def create_multi_scraper_parser(subparsers: Any) -> None:
     parser.add_argument(
         "--pages",
         "-p",
-        type=int,
+        type=_page_count,
         default=1,
-        choices=range(1, 61),
         metavar="[1-60]",
         help="Number of pages to scrape per query (default: 1, max: 60)",
     )
@@ -297,38 +313,8 @@ def create_multi_scraper_parser(subparsers: Any) -> None:
     parser.add_argument(
         "--fields",
         nargs="+",
-        choices=[
-            "Product ID",
-            "Title",
-            "Sale Price",
-            "Original Price",
-            "Discount (%)",
-            "Currency",
-            "Rating",
-            "Orders Count",
-            "Store Name",
-            "Store ID",
-            "Store URL",
-            "Product URL",
-            "Image URL",
-            "Brand",
-        ],
-        default=[
-            "Product ID",
-            "Title",
-            "Sale Price",
-            "Original Price",
-            "Discount (%)",
-            "Currency",
-            "Rating",
-            "Orders Count",
-            "Store Name",
-            "Store ID",
-            "Store URL",
-            "Product URL",
-            "Image URL",
-            "Brand",
-        ],
+        choices=ALL_FIELDS,
+        default=list(ALL_FIELDS),
         help="Fields to extract (default: all fields)",
     )
     parser.add_argument(
@@ -443,9 +429,6 @@ def create_store_retry_parser(subparsers: Any) -> None:
     parser.add_argument(
         "--delay", type=float, default=2.0, help="Delay between batches"
     )
-    parser.add_argument(
-        "--max-workers", type=int, default=3, help="Maximum concurrent workers"
-    )
     parser.add_argument(
         "--dry-run", action="store_true", help="Analyze only, don't process"
     )
@@ -459,41 +442,31 @@ def run_basic_scraper(args: argparse.Namespace) -> None:
     logger = ScraperLogger("CLI.Basic")
 
     try:
-        # Import from the core module
-        from aliexpress_scraper.core.scraper import main as scraper_main
-
-        # Convert args to sys.argv format for the original main function
-        sys.argv = ["scraper.py"]
-        sys.argv.extend(["--keyword", args.keyword])
-        sys.argv.extend(["--brand", args.brand])
-        sys.argv.extend(["--pages", str(args.pages)])
-
-        if args.discount:
-            sys.argv.append("--discount")
-        if args.free_shipping:
-            sys.argv.append("--free-shipping")
-        if args.min_price is not None:
-            sys.argv.extend(["--min-price", str(args.min_price)])
-        if args.max_price is not None:
-            sys.argv.extend(["--max-price", str(args.max_price)])
-
-        sys.argv.extend(["--delay", str(args.delay)])
-        sys.argv.extend(["--fields"] + args.fields)
-
-        if args.proxy_provider:
-            sys.argv.extend(["--proxy-provider", args.proxy_provider])
-        if args.enable_store_retry:
-            sys.argv.append("--enable-store-retry")
-        sys.argv.extend(["--store-retry-batch-size", str(args.store_retry_batch_size)])
-        sys.argv.extend(["--store-retry-delay", str(args.store_retry_delay)])
+        from aliexpress_scraper.core.scraper import ScrapeConfig
+        from aliexpress_scraper.core.scraper import run as scraper_run
+
+        config = ScrapeConfig(
+            keyword=args.keyword,
+            brand=args.brand,
+            pages=args.pages,
+            discount=args.discount,
+            free_shipping=args.free_shipping,
+            min_price=args.min_price,
+            max_price=args.max_price,
+            delay=args.delay,
+            fields=args.fields,
+            proxy_provider=args.proxy_provider,
+            enable_store_retry=args.enable_store_retry,
+            store_retry_batch_size=args.store_retry_batch_size,
+            store_retry_delay=args.store_retry_delay,
+        )
 
         logger.start(
             "Basic scraper execution",
             f"keyword: '{args.keyword}', brand: '{args.brand}'",
         )
 
-        # Run the main function
-        scraper_main()
+        scraper_run(config)
 
     except Exception as e:
         logger.error("Basic scraper execution failed", str(e))
@@ -502,6 +475,8 @@ def run_basic_scraper(args: argparse.Namespace) -> None:
 
 def run_enhanced_scraper(args: argparse.Namespace) -> None:
     """Run the enhanced scraper with provided arguments"""
+    import asyncio
+
     logger = ScraperLogger("CLI.Enhanced")
 
     try:
@@ -522,15 +497,17 @@ def run_enhanced_scraper(args: argparse.Namespace) -> None:
         )
 
         # Handle queries file vs single keyword
-        queries = []
+        queries: Iterable[str]
         if args.queries_file:
-            queries = read_queries_from_file(args.queries_file)
-            if not queries:
+            query_count = count_queries(args.queries_file)
+            if not query_count:
                 logger.error(
                     "Query processing failed", "No valid queries found in file"
                 )
                 sys.exit(1)
+            queries = read_queries_from_file(args.queries_file)
         else:
+            query_count = 1
             queries = [args.keyword]
 
         async def _runner() -> None:
@@ -543,43 +520,55 @@ def run_enhanced_scraper(args: argparse.Namespace) -> None:
                 store_retry_delay=args.store_retry_delay,
             )
 
-            all_results: list[dict[str, Any]] = []
-            all_products: list[dict[str, Any]] = []
+            stream = getattr(args, "stream", False)
+            merge = query_count > 1
             created_files: list[str] = []
+            successful_queries = 0
             total_products = 0
 
-            for i, query in enumerate(queries, 1):
-                logger.progress("Query processing", f"{i}/{len(queries)}: '{query}'")
+            # Non-streaming multi-query runs append each query's products to the
+            # merged files as they arrive instead of holding them all in memory
+            merged_writer = (
+                _MergedResultWriter(args.brand, list(ALL_FIELDS))
+                if merge and not stream
+                else None
+            )
 
-                results = await scraper.run_enhanced_scraper(
-                    keyword=query,
-                    brand=args.brand,
-                    max_pages=args.max_pages,
-                    save_to_file=not getattr(args, "stream", False),
-                    apply_discount_filter=args.discount_filter,
-                    apply_free_shipping_filter=args.free_shipping_filter,
-                    min_price=args.min_price,
-                    max_price=args.max_price,
-                    delay=args.delay,
-                    max_retries=args.max_retries,
-                    stream=getattr(args, "stream", False),
-                )
+            with merged_writer or contextlib.nullcontext():
+                for i, query in enumerate(queries, 1):
+                    logger.progress("Query processing", f"{i}/{query_count}: '{query}'")
 
-                if "error" in results:
-                    logger.error(f"Query '{query}' failed", results["error"])
-                else:
+                    results = await scraper.run_enhanced_scraper(
+                        keyword=query,
+                        brand=args.brand,
+                        max_pages=args.max_pages,
+                        save_to_file=not stream,
+                        apply_discount_filter=args.discount_filter,
+                        apply_free_shipping_filter=args.free_shipping_filter,
+                        min_price=args.min_price,
+                        max_price=args.max_price,
+                        delay=args.delay,
+                        max_retries=args.max_retries,
+                        stream=stream,
+                    )
+
+                    if "error" in results:
+                        logger.error(f"Query '{query}' failed", results["error"])
+                        continue
+
+                    successful_queries += 1
                     products = results.get("products", [])
                     total_streamed = results.get("total_streamed", 0)
                     product_count = len(products) if products else total_streamed
                     total_products += product_count
 
-                    # Collect products for merged file (non-streaming mode)
-                    if products:
-                        all_products.extend(products)
+                    if merged_writer:
+                        merged_writer.write_many(products)
 
-                    # Track created files for streaming merge
+                    # Track created JSONL files for streaming merge
+                    if results.get("jsonl_file"):
+                        created_files.append(results["jsonl_file"])
                     if results.get("json_file"):
-                        created_files.append(results["json_file"])
                         logger.save("JSON saved", results["json_file"])
                     if results.get("csv_file"):
                         logger.save("CSV saved", results["csv_file"])
@@ -588,133 +577,178 @@ def run_enhanced_scraper(args: argparse.Namespace) -> None:
                         f"Query '{query}' completed", f"{product_count} products"
                     )
 
-                all_results.append(results)
-
             # Create merged files if we have multiple queries
-            if len(queries) > 1:
+            if merge:
                 logger.process(
                     "Merge operation", "Creating consolidated files for all queries"
                 )
 
-                # Common fields for merged file
-                all_fields = [
-                    "Product ID",
-                    "Title",
-                    "Sale Price",
-                    "Original Price",
-                    "Discount (%)",
-                    "Currency",
-                    "Rating",
-                    "Orders Count",
-                    "Store Name",
-                    "Store ID",
-                    "Store URL",
-                    "Product URL",
-                    "Image URL",
-                    "Brand",
-                ]
-
-                if getattr(args, "stream", False) and created_files:
-                    # Streaming mode: merge from individual files
-                    merged_products: list[dict[str, Any]] = []
-
-                    for json_file in created_files:
-                        if os.path.exists(json_file):
-                            try:
-                                with open(json_file, "r", encoding="utf-8") as f:
-                                    file_data: Any = json.load(f)
-                                    if isinstance(file_data, list):
-                                        # Filter and type-cast valid product dictionaries
-                                        product_count = 0
-                                        item: Any
-                                        for item in file_data:  # type: ignore
-                                            if isinstance(item, dict):
-                                                merged_products.append(item)  # type: ignore[arg-type]
-                                                product_count += 1
-                                        logger.info(
-                                            f"✓ Merged {product_count} products from {os.path.basename(json_file)}"
-                                        )
-                                    else:
-                                        logger.info(
-                                            f"✓ Merged 0 products from {os.path.basename(json_file)}"
-                                        )
-                            except (json.JSONDecodeError, FileNotFoundError) as e:
-                                logger.warning(f"⚠️ Could not read {json_file}: {e}")
-
-                    if merged_products:
-                        from aliexpress_scraper.core.scraper import save_results
-
-                        merged_json_file, merged_csv_file = save_results(
-                            keyword="merged",
-                            data=merged_products,
-                            selected_fields=all_fields,
-                            brand=args.brand,
-                            log_callback=logger.info,
-                        )
-
-                        if merged_json_file:
-                            logger.save("Merged JSON saved", merged_json_file)
-                        if merged_csv_file:
-                            logger.save("Merged CSV saved", merged_csv_file)
-                        logger.info(
-                            f"📦 Total products in merged files: {len(merged_products)}"
-                        )
-
-                elif all_products:
-                    # Non-streaming mode: use collected products
-                    from aliexpress_scraper.core.scraper import save_results
-
-                    merged_json_file, merged_csv_file = save_results(
-                        keyword="merged",
-                        data=all_products,
-                        selected_fields=all_fields,
-                        brand=args.brand,
-                        log_callback=logger.info,
+                if stream and created_files:
+                    # Streaming mode: merge per-query JSONL files off the event loop
+                    merged_writer = await asyncio.to_thread(
+                        _stream_merge_jsonl, created_files, list(ALL_FIELDS), args.brand
                     )
 
-                    if merged_json_file:
-                        logger.save("Merged JSON saved", merged_json_file)
-                    if merged_csv_file:
-                        logger.save("Merged CSV saved", merged_csv_file)
+                if merged_writer and merged_writer.count:
+                    logger.save("Merged JSON saved", merged_writer.json_path)
+                    logger.save("Merged CSV saved", merged_writer.csv_path)
+                    logger.info(
+                        f"📦 Total products in merged files: {merged_writer.count}"
+                    )
 
-            # Summary for multiple queries
-            if len(queries) > 1:
-                successful_queries = sum(1 for r in all_results if "error" not in r)
+                # Summary for multiple queries
                 logger.summary(
                     [
-                        ("Total queries", len(queries)),
+                        ("Total queries", query_count),
                         ("Successful", successful_queries),
-                        ("Failed", len(queries) - successful_queries),
+                        ("Failed", query_count - successful_queries),
                         ("Total products", total_products),
                     ]
                 )
 
-        asyncio.run(_runner())
+        asyncio.run(_runner(), loop_factory=_event_loop_factory())
 
     except Exception as e:
         logger.error("Enhanced scraper execution failed", str(e))
         sys.exit(1)
 
 
+class _MergedResultWriter:
+    """Writes merged products to a JSON array and a CSV file, one batch per query.
+
+    Files go to results/aliexpress_<brand>_<date>_merged.{json,csv}, so they
+    never collide with the per-query files saved under the brand name. Both
+    files are removed again on exit if nothing was written.
+    """
+
+    def __init__(self, brand: str, fields: list[str]) -> None:
+        from aliexpress_scraper.core.scraper import backup_if_exists, result_paths
+
+        json_path, csv_path = result_paths(brand)
+        self.json_path = json_path.removesuffix(".json") + "_merged.json"
+        self.csv_path = csv_path.removesuffix(".csv") + "_merged.csv"
+        backup_if_exists(self.json_path)
+        backup_if_exists(self.csv_path)
+        self.fields = fields
+        self.count = 0
+
+    def __enter__(self) -> Self:
+        import csv
+
+        self._stack = contextlib.ExitStack()
+        self._json_file = self._stack.enter_context(
+            open(self.json_path, "wb", buffering=json_io.WRITE_BUFFER_SIZE)
+        )
+        csv_file = self._stack.enter_context(
+            open(
+                self.csv_path,
+                "w",
+                encoding="utf-8",
+                newline="",
+                buffering=json_io.WRITE_BUFFER_SIZE,
+            )
+        )
+        writer = csv.writer(csv_file)
+        writer.writerow(self.fields)
+        self._writerows = writer.writerows
+        self._json_file.write(b"[\n")
+        return self
+
+    def write_many(self, records: list[dict[str, Any]]) -> None:
+        """Append a batch of products to both files"""
+        if not records:
+            return
+        if self.count:
+            self._json_file.write(b",\n")
+        self._json_file.write(b",\n".join(map(json_io.dumps, records)))
+        # Plain rows in fixed column order; the C writer consumes the whole batch
+        fields = self.fields
+        self._writerows(
+            [record.get(field, "") for field in fields] for record in records
+        )
+        self.count += len(records)
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._json_file.write(b"\n]\n")
+        self._stack.close()
+        if not self.count:
+            os.remove(self.json_path)
+            os.remove(self.csv_path)
+
+
+def _read_file_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _load_json_file(path: str) -> Any:
+    return json_io.loads(_read_file_bytes(path))
+
+
+def _stream_merge_jsonl(
+    jsonl_files: list[str], fields: list[str], brand: str
+) -> _MergedResultWriter:
+    """Merge per-query JSONL files into one JSON/CSV pair, one file at a time.
+
+    Each file's records are written as one batch, and the next file is read
+    on a background thread while the current one is written, so at most two
+    per-query files are held in memory at once.
+    """
+    import concurrent.futures
+
+    logger = ScraperLogger("CLI.Enhanced")
+
+    with (
+        concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool,
+        _MergedResultWriter(brand, fields) as merged_writer,
+    ):
+        next_read = (
+            pool.submit(_read_file_bytes, jsonl_files[0]) if jsonl_files else None
+        )
+        for index, jsonl_file in enumerate(jsonl_files):
+            current_read = cast(concurrent.futures.Future[bytes], next_read)
+            if index + 1 < len(jsonl_files):
+                next_read = pool.submit(_read_file_bytes, jsonl_files[index + 1])
+
+            records: list[dict[str, Any]] = []
+            try:
+                for line in current_read.result().splitlines():
+                    if not line.strip():
+                        continue
+                    record: Any = json_io.loads(line)
+                    if isinstance(record, dict):
+                        records.append(cast(dict[str, Any], record))
+                logger.info(
+                    f"✓ Merged {len(records)} products from {os.path.basename(jsonl_file)}"
+                )
+            except (json_io.JSONDecodeError, FileNotFoundError) as e:
+                logger.warning("Could not read JSONL file", f"{jsonl_file}: {e}")
+
+            # Records decoded before an error are still kept
+            merged_writer.write_many(records)
+
+    return merged_writer
+
+
 def run_transform(args: argparse.Namespace) -> None:
     """Run the data transformation utility"""
     logger = ScraperLogger("CLI.Transform")
 
     try:
-        # Import from the utils module
-        from aliexpress_scraper.utils.transform_to_listing import main as transform_main
+        from aliexpress_scraper.utils.transform_to_listing import (
+            TransformConfig,
+        )
+        from aliexpress_scraper.utils.transform_to_listing import (
+            run as transform_run,
+        )
 
-        # Convert args to sys.argv format that matches transform_to_listing.py expectations
-        sys.argv = ["transform_to_listing.py", args.input_file]
-        if hasattr(args, "output") and args.output:
-            sys.argv.extend(["-o", args.output])
-        if hasattr(args, "format") and args.format:
-            sys.argv.extend(["-f", args.format])
+        config = TransformConfig(
+            input_file=args.input_file, output=args.output, format=args.format
+        )
 
         logger.start("Data transformation", f"input: {args.input_file}")
 
-        # Run the main function
-        transform_main()
+        transform_run(config)
 
     except Exception as e:
         logger.error("Data transformation failed", str(e))
@@ -726,39 +760,39 @@ def run_store_retry(args: argparse.Namespace) -> None:
     logger = ScraperLogger("CLI.StoreRetry")
 
     try:
-        # Import from the utils module
-        from aliexpress_scraper.utils.standalone_store_retry import main as retry_main
-
-        # Convert args to sys.argv format
-        sys.argv = ["standalone_store_retry.py", args.input_file]
-        if args.output_file:
-            sys.argv.append(args.output_file)
-        if args.proxy_provider:
-            sys.argv.extend(["--proxy-provider", args.proxy_provider])
-        sys.argv.extend(["--batch-size", str(args.batch_size)])
-        sys.argv.extend(["--delay", str(args.delay)])
-        sys.argv.extend(["--max-workers", str(args.max_workers)])
-        if args.dry_run:
-            sys.argv.append("--dry-run")
+        from aliexpress_scraper.utils.standalone_store_retry import (
+            StoreRetryConfig,
+        )
+        from aliexpress_scraper.utils.standalone_store_retry import run as retry_run
+
+        config = StoreRetryConfig(
+            input_file=args.input_file,
+            output_file=args.output_file,
+            proxy_provider=args.proxy_provider,
+            batch_size=args.batch_size,
+            delay=args.delay,
+            dry_run=args.dry_run,
+        )
 
         logger.start("Store retry processing", f"input: {args.input_file}")
 
-        # Run the async main function
-        retry_main()
+        retry_run(config)
 
     except Exception as e:
         logger.error("Store retry processing failed", str(e))
         sys.exit(1)
 
 
-def read_queries_from_file(file_path: str) -> list[str]:
-    """Read search queries from a text file, one per line"""
-    logger = ScraperLogger("CLI.QueryReader")
+def read_queries_from_file(file_path: str) -> Iterator[str]:
+    """Lazily yield search queries from a text file, one per line"""
+    logger = _query_logger
 
     try:
         with open(file_path, "r", encoding="utf-8") as f:
-            queries = [line.strip() for line in f if line.strip()]
-        return queries
+            for line in f:
+                query = line.strip()
+                if query:
+                    yield query
     except FileNotFoundError:
         logger.error("Queries file not found", file_path)
         sys.exit(1)
@@ -767,69 +801,103 @@ def read_queries_from_file(file_path: str) -> list[str]:
         sys.exit(1)
 
 
+def count_queries(file_path: str) -> int:
+    """Count the queries read_queries_from_file yields, without keeping them"""
+    # Same line splitting and blank-line test as the reader, so totals match
+    return sum(1 for _ in read_queries_from_file(file_path))
+
+
+# Deletes every ASCII character that is not a letter, digit, space, "-" or "_"
+_FILENAME_DELETE_TABLE = str.maketrans(
+    "",
+    "",
+    "".join(
+        chr(c)
+        for c in range(128)
+        if chr(c) not in string.ascii_letters + string.digits + " -_"
+    ),
+)
+
+
 def generate_output_filename(query: str, prefix: str = "aliexpress") -> str:
     """Generate a stable output filename for a query (no timestamp)."""
     # Clean the query for filename use
-    clean_query = "".join(
-        c for c in query if c.isalnum() or c in (" ", "-", "_")
-    ).rstrip()
+    if query.isascii():
+        clean_query = query.translate(_FILENAME_DELETE_TABLE).rstrip()
+    else:
+        # Unicode letters/digits are kept, which the ASCII table can't express
+        clean_query = "".join(
+            c for c in query if c.isalnum() or c in (" ", "-", "_")
+        ).rstrip()
     clean_query = clean_query.replace(" ", "_").lower()
 
     return f"{prefix}_{clean_query}.json"
 
 
+def _map_bounded(
+    executor: "concurrent.futures.Executor",
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    window: int,
+) -> Iterator[Any]:
+    """Like executor.map, but with at most `window` tasks submitted at a time.
+
+    executor.map submits every item up front, which drains a lazy query
+    iterator and creates one future per query before any result is read.
+    """
+    from collections import deque
+
+    pending: deque[concurrent.futures.Future[Any]] = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
 def run_single_scraper(
-    args: tuple[str, MultiScraperArgset, str],
+    args: tuple[str, ScraperArgs],
 ) -> tuple[str, str, bool]:
     """Run a single scraper instance for one query"""
-    query, scraper_args, scraper_type = args
-    logger = ScraperLogger("CLI.MultiScraper")
+    query, scraper_args = args
+    scraper_type = scraper_args.scraper_type
+    logger = _task_logger
+    task_dir: Optional[str] = None
 
     try:
         logger.process("Scraper starting", f"query: '{query}'")
 
-        # Keep track of existing files before running scraper
-        results_dir: str = "results"
-        existing_files: set[str] = set()
-        if os.path.exists(results_dir):
-            existing_files = set(os.listdir(results_dir))
+        # Each task saves into its own directory, so concurrent threads never
+        # overwrite or pick up each other's files (they share brand and date)
+        os.makedirs(_RESULTS_DIR, exist_ok=True)
+        task_dir = tempfile.mkdtemp(prefix=".task-", dir=_RESULTS_DIR)
+        new_json_file: Optional[str] = None
+        new_csv_file: Optional[str] = None
 
         if scraper_type == "basic":
-            from aliexpress_scraper.core.scraper import main as scraper_main
-
-            # Prepare sys.argv for the scraper
-            original_argv = sys.argv.copy()
-            sys.argv = ["scraper.py"]
-            sys.argv.extend(["--keyword", query])
-            sys.argv.extend(["--brand", scraper_args.brand])
-            sys.argv.extend(["--pages", str(scraper_args.pages)])
-
-            if scraper_args.discount:
-                sys.argv.append("--discount")
-            if scraper_args.free_shipping:
-                sys.argv.append("--free-shipping")
-            if scraper_args.min_price is not None:
-                sys.argv.extend(["--min-price", str(scraper_args.min_price)])
-            if scraper_args.max_price is not None:
-                sys.argv.extend(["--max-price", str(scraper_args.max_price)])
-
-            sys.argv.extend(["--delay", str(scraper_args.delay)])
-            sys.argv.extend(["--fields"] + scraper_args.fields)
-
-            if scraper_args.proxy_provider:
-                sys.argv.extend(["--proxy-provider", scraper_args.proxy_provider])
-            if scraper_args.enable_store_retry:
-                sys.argv.append("--enable-store-retry")
-            sys.argv.extend(
-                ["--store-retry-batch-size", str(scraper_args.store_retry_batch_size)]
-            )
-            sys.argv.extend(
-                ["--store-retry-delay", str(scraper_args.store_retry_delay)]
-            )
+            # Already imported by run_multi_scraper, so this is a cache hit
+            from aliexpress_scraper.core.scraper import ScrapeConfig
+            from aliexpress_scraper.core.scraper import run as scrape_run
 
-            # Run the scraper
-            scraper_main()
-            sys.argv = original_argv
+            new_json_file, new_csv_file = scrape_run(
+                ScrapeConfig(
+                    keyword=query,
+                    brand=scraper_args.brand,
+                    pages=scraper_args.pages,
+                    discount=scraper_args.discount,
+                    free_shipping=scraper_args.free_shipping,
+                    min_price=scraper_args.min_price,
+                    max_price=scraper_args.max_price,
+                    delay=scraper_args.delay,
+                    fields=list(scraper_args.fields),
+                    proxy_provider=scraper_args.proxy_provider,
+                    enable_store_retry=scraper_args.enable_store_retry,
+                    store_retry_batch_size=scraper_args.store_retry_batch_size,
+                    store_retry_delay=scraper_args.store_retry_delay,
+                    results_dir=task_dir,
+                )
+            )
 
         elif scraper_type == "enhanced":
             # Enhanced scraper in multi-query mode is currently not supported due to complexity
@@ -846,54 +914,22 @@ def run_single_scraper(
             )
             return query, "", False
 
-        # Find the newly created JSON and CSV files
-        new_json_file: Optional[str] = None
-        new_csv_file: Optional[str] = None
-        if os.path.exists(results_dir):
-            current_files: set[str] = set(os.listdir(results_dir))
-            new_files: set[str] = current_files - existing_files
-            json_files: list[str] = [f for f in new_files if f.endswith(".json")]
-            csv_files: list[str] = [f for f in new_files if f.endswith(".csv")]
-
-            if json_files:
-                # Get the most recently created JSON file
-                json_files.sort(
-                    key=lambda x: os.path.getmtime(os.path.join(results_dir, x)),
-                    reverse=True,
-                )
-                new_json_file = json_files[0]
-            # Prefer the CSV with the same original base name as the JSON, fall back to latest CSV
-            if new_json_file:
-                candidate_csv = os.path.splitext(new_json_file)[0] + ".csv"
-                if candidate_csv in current_files:
-                    new_csv_file = candidate_csv
-                elif csv_files:
-                    csv_files.sort(
-                        key=lambda x: os.path.getmtime(os.path.join(results_dir, x)),
-                        reverse=True,
-                    )
-                    new_csv_file = csv_files[0]
-
         if new_json_file:
             # Generate new filename based on query (no timestamp)
             new_json_filename: str = generate_output_filename(
                 query, scraper_args.output_prefix
             )
-            base_no_ext, _ = os.path.splitext(new_json_filename)
-            new_csv_filename: str = f"{base_no_ext}.csv"
-
-            old_json_path: str = os.path.join(results_dir, new_json_file)
-            new_json_path: str = os.path.join(results_dir, new_json_filename)
+            new_csv_filename: str = Path(new_json_filename).with_suffix(".csv").name
+            results_path = Path(_RESULTS_DIR)
 
-            # Rename the file to include the query
-            os.rename(old_json_path, new_json_path)
+            # Move the file out under a name with the query; replace() also
+            # overwrites the output of an earlier run for the same query
+            Path(new_json_file).replace(results_path / new_json_filename)
 
-            # Try to rename the corresponding CSV to match the same base name
+            # Try to move the corresponding CSV to the same base name
             if new_csv_file:
-                old_csv_path: str = os.path.join(results_dir, new_csv_file)
-                new_csv_path: str = os.path.join(results_dir, new_csv_filename)
                 try:
-                    os.rename(old_csv_path, new_csv_path)
+                    Path(new_csv_file).replace(results_path / new_csv_filename)
                 except Exception as e:
                     logger.warning(
                         "Could not rename CSV file",
@@ -910,19 +946,26 @@ def run_single_scraper(
             logger.warning("No JSON output file found", f"query: '{query}'")
             return query, "", False
 
-    except subprocess.TimeoutExpired:
-        logger.error("Scraper timeout", f"query '{query}' exceeded 15 minutes")
-        return query, "", False
     except Exception as e:
         logger.error("Scraper error", f"query '{query}': {e}")
         return query, "", False
+    finally:
+        if task_dir:
+            shutil.rmtree(task_dir, ignore_errors=True)
 
 
 def merge_json_results_to_csv(
     json_files: list[str], output_prefix: str = "aliexpress"
 ) -> str:
     """Merge multiple JSON result files into a single CSV and emit a merged JSON as well."""
-    logger = ScraperLogger("CLI.Merge")
+    import concurrent.futures
+    import csv
+
+    logger = _merge_logger
+
+    if not json_files:
+        logger.error("No JSON files to merge")
+        return ""
 
     try:
         # Output filenames without timestamps for stability
@@ -930,48 +973,81 @@ def merge_json_results_to_csv(
         json_merged_filename = f"{output_prefix}_merged.json"
 
         all_data: list[dict[str, Any]] = []
-
-        # Read all JSON files
-        for json_file in json_files:
-            if os.path.exists(json_file):
+        # Columns in first-seen order, i.e. the scraper's field order
+        all_keys: dict[str, None] = {}
+
+        # Read all JSON files, writing the merged JSON and collecting CSV
+        # headers in the same pass. The JSON goes to a temporary file so an
+        # earlier merge is only replaced once there is data to replace it with.
+        os.makedirs(_RESULTS_DIR, exist_ok=True)
+        json_path = _RESULTS_PREFIX + json_merged_filename
+        json_tmp_path = f"{json_path}.tmp"
+        with (
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, len(json_files))
+            ) as pool,
+            open(json_tmp_path, "wb", buffering=json_io.WRITE_BUFFER_SIZE) as jf,
+        ):
+            # Source files are read and parsed concurrently, then consumed in
+            # their original order
+            loads = [
+                pool.submit(_load_json_file, json_file) for json_file in json_files
+            ]
+            jf.write(b"[")
+            for json_file, load in zip(json_files, loads):
                 try:
-                    with open(json_file, "r", encoding="utf-8") as f:
-                        data_obj: Any = json.load(f)
-                        if isinstance(data_obj, list):
-                            for d in cast(list[Any], data_obj):
-                                if isinstance(d, dict):
-                                    all_data.append(cast(dict[str, Any], d))
-                        elif isinstance(data_obj, dict):
-                            all_data.append(cast(dict[str, Any], data_obj))
+                    data_obj: Any = load.result()
+                except FileNotFoundError:
+                    logger.warning("File not found", json_file)
+                    continue
                 except Exception as e:
                     logger.warning("Could not read JSON file", f"{json_file}: {e}")
-            else:
-                logger.warning("File not found", json_file)
+                    continue
+
+                records: list[Any] = (
+                    cast(list[Any], data_obj)
+                    if isinstance(data_obj, list)
+                    else [data_obj]
+                )
+                for record in records:
+                    if not isinstance(record, dict):
+                        continue
+                    item = cast(dict[str, Any], record)
+                    jf.write(b",\n" if all_data else b"\n")
+                    jf.write(json_io.dumps(item))
+                    all_keys.update(dict.fromkeys(item))
+                    all_data.append(item)
+            jf.write(b"\n]\n")
 
         if not all_data:
+            os.remove(json_tmp_path)
             logger.error("No data found in any JSON files")
             return ""
+        os.replace(json_tmp_path, json_path)
 
-        # Get all unique keys for CSV headers
-        all_keys: set[str] = set()
-        for item in all_data:
-            all_keys.update(item.keys())
-
-        fieldnames: list[str] = sorted(list(all_keys))
-
-        # Write merged JSON
-        os.makedirs("results", exist_ok=True)
-        json_path = os.path.join("results", json_merged_filename)
-        with open(json_path, "w", encoding="utf-8") as jf:
-            json.dump(all_data, jf, ensure_ascii=False, indent=2)
+        fieldnames: list[str] = list(all_keys)
 
         # Write merged CSV
-        csv_path = os.path.join("results", csv_filename)
-        with open(csv_path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for item in all_data:
-                writer.writerow(item)
+        csv_path = _RESULTS_PREFIX + csv_filename
+        with open(
+            csv_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=json_io.WRITE_BUFFER_SIZE,
+        ) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            # Records carrying every column (the usual case) are read with a
+            # C-level itemgetter; only sparse ones fall back to per-key get()
+            field_count = len(fieldnames)
+            get_row = itemgetter(*fieldnames) if field_count > 1 else None
+            writer.writerows(
+                get_row(item)
+                if get_row is not None and len(item) == field_count
+                else [item.get(key, "") for key in fieldnames]
+                for item in all_data
+            )
 
         logger.success("Merged results saved", csv_path)
         logger.info("Merged JSON saved", json_path)
@@ -985,59 +1061,70 @@ def merge_json_results_to_csv(
 
 def run_multi_scraper(args: argparse.Namespace) -> None:
     """Run parallel scraping for multiple queries"""
+    import concurrent.futures
+
     logger = ScraperLogger("CLI.Multi")
 
     try:
         logger.start("Starting parallel scraping", f"queries from: {args.queries_dir}")
 
-        # Read queries from file
-        queries: list[str] = read_queries_from_file(args.queries_dir)
-        if not queries:
+        # Count queries up front; the queries themselves are read lazily
+        query_count = count_queries(args.queries_dir)
+        if not query_count:
             logger.error("No queries found in file")
             sys.exit(1)
 
-        logger.info("Queries found", f"{len(queries)} to process")
+        logger.info("Queries found", f"{query_count} to process")
         logger.info("Scraper type", args.scraper_type)
 
         # Determine number of workers
-        max_workers: int = args.max_workers if args.max_workers else mp.cpu_count()
+        max_workers: int = args.max_workers or os.cpu_count() or 1
         logger.config("Parallel workers", str(max_workers))
 
-        # Prepare arguments for each scraper
-        # Cast args to MultiScraperArgset for typing purposes
-        typed_args: MultiScraperArgset = cast(MultiScraperArgset, args)
-        scraper_tasks: list[tuple[str, MultiScraperArgset, str]] = [
-            (query, typed_args, args.scraper_type) for query in queries
-        ]
+        # Prepare arguments for each scraper; every task shares one instance
+        scraper_args = ScraperArgs(
+            brand=args.brand,
+            pages=args.pages,
+            discount=args.discount,
+            free_shipping=args.free_shipping,
+            min_price=args.min_price,
+            max_price=args.max_price,
+            delay=args.delay,
+            fields=tuple(args.fields),
+            proxy_provider=args.proxy_provider,
+            enable_store_retry=args.enable_store_retry,
+            store_retry_batch_size=args.store_retry_batch_size,
+            store_retry_delay=args.store_retry_delay,
+            output_prefix=args.output_prefix,
+            scraper_type=args.scraper_type,
+        )
+        scraper_tasks: Iterator[tuple[str, ScraperArgs]] = (
+            (query, scraper_args) for query in read_queries_from_file(args.queries_dir)
+        )
+
+        # Run scrapers in parallel on threads: scraping is network-bound, so
+        # worker processes only added interpreter startup and pickling costs.
+        # Import the scraper up front so threads don't race on the import lock.
+        import aliexpress_scraper.core.scraper  # noqa: F401
 
-        # Run scrapers in parallel using ProcessPoolExecutor
         results: list[tuple[str, bool]] = []
         json_files: list[str] = []
 
         start_time = time.time()
 
-        with concurrent.futures.ProcessPoolExecutor(
-            max_workers=max_workers
+        # run_single_scraper never raises, it reports failures through its
+        # return value
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="scraper"
         ) as executor:
-            # Submit all tasks
-            future_to_query: dict[
-                concurrent.futures.Future[tuple[str, str, bool]], str
-            ] = {
-                executor.submit(run_single_scraper, task): task[0]
-                for task in scraper_tasks
-            }
-
-            # Process completed tasks
-            for future in concurrent.futures.as_completed(future_to_query):
-                query: str = future_to_query[future]
-                try:
-                    query_result, output_file, success = future.result()
-                    results.append((query_result, success))
-                    if success and output_file:
-                        json_files.append(os.path.join("results", output_file))
-                except Exception as e:
-                    logger.error("Exception for query", f"'{query}': {e}")
-                    results.append((query, False))
+            # Keep a couple of tasks queued per worker so reading the query
+            # file stays lazy
+            for query_result, output_file, success in _map_bounded(
+                executor, run_single_scraper, scraper_tasks, window=max_workers * 2
+            ):
+                results.append((query_result, success))
+                if success and output_file:
+                    json_files.append(_RESULTS_PREFIX + output_file)
 
         end_time = time.time()
 
@@ -1069,8 +1156,38 @@ def run_multi_scraper(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the main CLI parser"""
+_SCRAPER_PARSERS: dict[str, Callable[[Any], None]] = {
+    "basic": create_basic_scraper_parser,
+    "enhanced": create_enhanced_scraper_parser,
+    "multi": create_multi_scraper_parser,
+}
+
+_UTILITY_PARSERS: dict[str, Callable[[Any], None]] = {
+    "transform": create_transform_parser,
+    "store-retry": create_store_retry_parser,
+}
+
+
+def create_parser(argv: Optional[list[str]] = None) -> argparse.ArgumentParser:
+    """Create the main CLI parser
+
+    Only the subcommand named in argv (default: sys.argv[1:]) gets its
+    arguments registered; top-level help or unknown commands build them all.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    operation = argv[0] if argv else None
+    scraper_type = argv[1] if operation == "scrape" and len(argv) > 1 else None
+
+    scraper_builders = list(_SCRAPER_PARSERS.values())
+    utility_builders = list(_UTILITY_PARSERS.values())
+    if operation in _UTILITY_PARSERS:
+        scraper_builders = []
+        utility_builders = [_UTILITY_PARSERS[operation]]
+    elif scraper_type in _SCRAPER_PARSERS:
+        scraper_builders = [_SCRAPER_PARSERS[scraper_type]]
+        utility_builders = []
+
     parser = argparse.ArgumentParser(
         description="AliExpress Scraper CLI - Unified interface for all scraping operations",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1120,13 +1237,12 @@ Examples:
     )
 
     # Add scraper parsers
-    create_basic_scraper_parser(scrape_subparsers)
-    create_enhanced_scraper_parser(scrape_subparsers)
-    create_multi_scraper_parser(scrape_subparsers)
+    for build_parser in scraper_builders:
+        build_parser(scrape_subparsers)
 
     # Add utility parsers
-    create_transform_parser(subparsers)
-    create_store_retry_parser(subparsers)
+    for build_parser in utility_builders:
+        build_parser(subparsers)
 
     return parser
 
@@ -1135,8 +1251,9 @@ def main() -> None:
     """Main entry point for the CLI application"""
     logger = ScraperLogger("CLI.Main")
 
-    parser = create_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    parser = create_parser(argv)
+    args = parser.parse_args(argv)
 
     # Handle case where no operation is specified
     if not hasattr(args, "func"):
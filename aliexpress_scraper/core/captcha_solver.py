@@ -8,7 +8,7 @@ Adapted from French programmer's solution with enhanced integration capabilities
 import asyncio
 import random
 import time
-from typing import Any
+from typing import Any, Self
 
 from playwright.async_api import Browser, BrowserContext, Page, async_playwright
 
@@ -632,6 +632,65 @@ class CaptchaSolverContext:
         await self.solver.close()
 
 
+class CaptchaSolverPool:
+    """
+    Keeps started captcha solvers open so later solve calls skip browser launch.
+
+    Each solver drives a single page, so callers acquire one per concurrent
+    worker and release it when done. Use as an async context manager or call
+    close() to shut the browsers down.
+    """
+
+    def __init__(
+        self, headless: bool = True, proxy_config: dict[str, str] | None = None
+    ):
+        self.headless = headless
+        self.proxy_config = proxy_config
+        self._idle: list[AliExpressCaptchaSolver] = []
+        self._solvers: list[AliExpressCaptchaSolver] = []
+
+    async def acquire(self) -> AliExpressCaptchaSolver:
+        """Return an idle solver, starting a new browser if none is free"""
+        if self._idle:
+            return self._idle.pop()
+        solver = AliExpressCaptchaSolver(
+            headless=self.headless, proxy_config=self.proxy_config
+        )
+        self._solvers.append(solver)
+        try:
+            await solver.start_browser()
+        except BaseException:
+            self._solvers.remove(solver)
+            await solver.close()
+            raise
+        return solver
+
+    async def release(self, solver: AliExpressCaptchaSolver) -> None:
+        """Return a solver to the pool, or close it if its browser has died"""
+        if solver.browser is not None and solver.browser.is_connected():
+            self._idle.append(solver)
+            return
+        # A crashed or disconnected browser would fail every later solve
+        if solver in self._solvers:
+            self._solvers.remove(solver)
+        try:
+            await solver.close()
+        except Exception as e:
+            print(f"⚠️ Error closing disconnected captcha solver: {e}")
+
+    async def close(self) -> None:
+        """Close every browser the pool started"""
+        solvers, self._solvers, self._idle = self._solvers, [], []
+        for solver in solvers:
+            await solver.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+
+
 def main():
     """Example usage"""
 
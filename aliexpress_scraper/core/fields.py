@@ -0,0 +1,30 @@
+"""Product field names and helpers shared by the scrapers and the CLI"""
+
+# All fields extract_product_details can produce, in output column order
+ALL_FIELDS: tuple[str, ...] = (
+    "Product ID",
+    "Title",
+    "Sale Price",
+    "Original Price",
+    "Discount (%)",
+    "Currency",
+    "Rating",
+    "Orders Count",
+    "Store Name",
+    "Store ID",
+    "Store URL",
+    "Product URL",
+    "Image URL",
+    "Brand",
+)
+
+# Store fields that store-info retries try to fill in
+STORE_FIELDS: tuple[str, ...] = ("Store Name", "Store ID", "Store URL")
+
+# Placeholder values that count as missing store information
+MISSING_VALUES: frozenset[str | None] = frozenset((None, "null", "", "N/A"))
+
+
+def build_product_url(product_id: str) -> str:
+    """Product page URL for an AliExpress product ID"""
+    return f"https://www.aliexpress.com/item/{product_id}.html"
@@ -6,6 +6,7 @@ import os
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from queue import Queue
 from typing import Any, Callable, Generator
 from urllib.parse import quote_plus
@@ -14,7 +15,9 @@ import requests
 from dotenv import load_dotenv
 from playwright.sync_api import Route, sync_playwright
 
+from ..utils import json_io
 from ..utils.logger import ScraperLogger
+from .fields import ALL_FIELDS, build_product_url
 
 # Load environment variables from .env file
 load_dotenv()
@@ -24,6 +27,12 @@ RESULTS_DIR = "results"
 SESSION_CACHE_FILE = "session_cache.json"
 CACHE_EXPIRATION_SECONDS = 30 * 60
 
+# Last session cache read or written, keyed by the file's mtime
+_session_cache: tuple[int, dict[str, Any]] | None = None
+
+# Resource types aborted while fetching a fresh session
+_BLOCKED_RESOURCE_TYPES = frozenset({"stylesheet", "image", "font", "media"})
+
 # --- Oxylabs U.S. Residential Proxy Configuration from Environment ---
 OXYLABS_USERNAME = os.getenv("OXYLABS_USERNAME")
 OXYLABS_PASSWORD = os.getenv("OXYLABS_PASSWORD")
@@ -83,12 +92,23 @@ def initialize_session_data(
     if proxy_provider:
         validate_proxy_credentials(proxy_provider)
 
+    global _session_cache
     cached_data = None
 
-    if os.path.exists(SESSION_CACHE_FILE):
+    try:
+        mtime_ns: int | None = os.stat(SESSION_CACHE_FILE).st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+
+    if mtime_ns is not None:
         try:
-            with open(SESSION_CACHE_FILE, "r") as f:
-                cached_data = json.load(f)
+            # Only re-parse the file when it changed since we last saw it
+            if _session_cache and _session_cache[0] == mtime_ns:
+                cached_data = _session_cache[1]
+            else:
+                with open(SESSION_CACHE_FILE, "rb") as f:
+                    cached_data = json_io.loads(f.read())
+                _session_cache = (mtime_ns, cached_data)
             saved_timestamp = cached_data.get("timestamp", 0)
             current_timestamp = time.time()
             cache_age = current_timestamp - saved_timestamp
@@ -103,13 +123,11 @@ def initialize_session_data(
                     f"Cached session data expired (Age: {datetime.timedelta(seconds=int(cache_age))})."
                 )
 
-        except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
+        except (json_io.JSONDecodeError, FileNotFoundError, KeyError) as e:
             log_callback(
                 f"Error reading cache file or cache invalid ({e}). Will fetch fresh session."
             )
             cached_data = None
-    else:
-        pass
 
     # --- Cache Miss or Expired: Launch Browser ---
     if proxy_provider:
@@ -178,7 +196,7 @@ def initialize_session_data(
             nonlocal blocked_requests, total_requests
             total_requests += 1
 
-            if route.request.resource_type in ["stylesheet", "image", "font", "media"]:
+            if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
                 blocked_requests += 1
                 route.abort()
             else:
@@ -229,6 +247,7 @@ def initialize_session_data(
         try:
             with open(SESSION_CACHE_FILE, "w") as f:
                 json.dump(cache_content, f, indent=4)
+            _session_cache = (os.stat(SESSION_CACHE_FILE).st_mtime_ns, cache_content)
             log_callback("Session data cached successfully.")
         except IOError as e:
             log_callback(f"Error saving session cache: {e}")
@@ -704,7 +723,7 @@ def fetch_single_store_with_captcha_fallback(
 
         import requests
 
-        product_url = f"https://www.aliexpress.com/item/{product_id}.html"
+        product_url = build_product_url(product_id)
 
         # Enhanced headers to avoid detection
         headers = {
@@ -896,7 +915,7 @@ def fetch_store_info_batch_basic(
     ) -> dict[str, str | None] | None:
         """Fetch store info for a single product using Playwright browser"""
         try:
-            product_url = f"https://www.aliexpress.com/item/{product_id}.html"
+            product_url = build_product_url(product_id)
             page = browser_obj["page"]
 
             if proxy_provider:
@@ -1181,9 +1200,7 @@ def extract_product_details(
         trade_info = product.get("trade", {})
         orders_count = trade_info.get("realTradeCount")
         rating = product.get("evaluation", {}).get("starRating")
-        product_url = (
-            f"https://www.aliexpress.com/item/{product_id}.html" if product_id else None
-        )
+        product_url = build_product_url(product_id) if product_id else None
 
         # --- Store all potentially extractable data in a temporary dict ---
         full_details: dict[str, Any] = {
@@ -1215,12 +1232,69 @@ def extract_product_details(
     return extracted_data
 
 
+# ASCII translation table for file-name slugs: lowercase alphanumerics, "_" otherwise
+_SLUG_TABLE = str.maketrans(
+    {chr(c): chr(c).lower() if chr(c).isalnum() else "_" for c in range(128)}
+)
+
+
+def slugify(name: str) -> str:
+    """Returns a lowercase, underscore-separated slug for use in file names"""
+    if not name:
+        return "unknown"
+    if name.isascii():
+        return name.translate(_SLUG_TABLE)
+    return "".join(c.lower() if c.isalnum() else "_" for c in name)
+
+
+def result_paths(brand: str, results_dir: str = RESULTS_DIR) -> tuple[str, str]:
+    """
+    Returns the (json, csv) result paths for a brand, creating results_dir if needed.
+    Format: results/aliexpress_<brand>_<date>.<file_extension>
+    """
+    os.makedirs(results_dir, exist_ok=True)
+
+    # Generate filename components
+    brand_safe = slugify(brand)
+    date_str = datetime.datetime.now().strftime("%Y%m%d")
+
+    # Create filename format without unix timestamp for stability
+    base_filename = f"aliexpress_{brand_safe}_{date_str}"
+    return (
+        os.path.join(results_dir, f"{base_filename}.json"),
+        os.path.join(results_dir, f"{base_filename}.csv"),
+    )
+
+
+def backup_if_exists(path: str) -> None:
+    """Rename an existing file to the next free <name>.bakN<ext> slot."""
+    if not os.path.exists(path):
+        return
+    directory, name = os.path.split(path)
+    base, ext = os.path.splitext(name)
+    prefix = f"{base}.bak"
+    # One directory scan instead of probing .bak1, .bak2, ... in turn
+    highest = 0
+    with os.scandir(directory or ".") as entries:
+        for entry in entries:
+            entry_name = entry.name
+            if entry_name.startswith(prefix) and entry_name.endswith(ext):
+                n = entry_name[len(prefix) : len(entry_name) - len(ext)]
+                if n.isdigit():
+                    highest = max(highest, int(n))
+    try:
+        os.replace(path, os.path.join(directory, f"{prefix}{highest + 1}{ext}"))
+    except OSError:
+        pass
+
+
 def save_results(
     keyword: str,
     data: list[dict[str, Any]],
     selected_fields: list[str],
     brand: str = "",
     log_callback: Callable[[str], None] = default_logger,
+    results_dir: str = RESULTS_DIR,
 ) -> tuple[str | None, str | None]:
     """
     Saves the extracted data to JSON and CSV files, named using brand, date, and timestamp.
@@ -1234,43 +1308,22 @@ def save_results(
         log_callback("No fields selected for saving.")
         return None, None
 
-    os.makedirs(RESULTS_DIR, exist_ok=True)
-
-    # Generate filename components
-    brand_safe = (
-        "".join(c.lower() if c.isalnum() else "_" for c in brand)
-        if brand
-        else "unknown"
-    )
-    date_str = datetime.datetime.now().strftime("%Y%m%d")
-
-    # Create filename format without unix timestamp for stability
-    base_filename = f"aliexpress_{brand_safe}_{date_str}"
-    json_filename = os.path.join(RESULTS_DIR, f"{base_filename}.json")
-    csv_filename = os.path.join(RESULTS_DIR, f"{base_filename}.csv")
-
-    def _backup_if_exists(path: str) -> None:
-        if os.path.exists(path):
-            base, ext = os.path.splitext(path)
-            n = 1
-            while True:
-                candidate = f"{base}.bak{n}{ext}"
-                if not os.path.exists(candidate):
-                    try:
-                        os.rename(path, candidate)
-                    except Exception:
-                        pass
-                    break
-                n += 1
+    json_filename, csv_filename = result_paths(brand, results_dir)
 
     try:
-        _backup_if_exists(json_filename)
-        _backup_if_exists(csv_filename)
-        with open(json_filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        backup_if_exists(json_filename)
+        backup_if_exists(csv_filename)
+        with open(json_filename, "wb", buffering=json_io.WRITE_BUFFER_SIZE) as f:
+            f.write(json_io.dumps(data, indent=True))
 
         fieldnames = selected_fields
-        with open(csv_filename, "w", encoding="utf-8", newline="") as f:
+        with open(
+            csv_filename,
+            "w",
+            encoding="utf-8",
+            newline="",
+            buffering=json_io.WRITE_BUFFER_SIZE,
+        ) as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
             writer.writeheader()
             writer.writerows(data)
@@ -1445,38 +1498,8 @@ Examples:
     parser.add_argument(
         "--fields",
         nargs="+",
-        choices=[
-            "Product ID",
-            "Title",
-            "Sale Price",
-            "Original Price",
-            "Discount (%)",
-            "Currency",
-            "Rating",
-            "Orders Count",
-            "Store Name",
-            "Store ID",
-            "Store URL",
-            "Product URL",
-            "Image URL",
-            "Brand",
-        ],
-        default=[
-            "Product ID",
-            "Title",
-            "Sale Price",
-            "Original Price",
-            "Discount (%)",
-            "Currency",
-            "Rating",
-            "Orders Count",
-            "Store Name",
-            "Store ID",
-            "Store URL",
-            "Product URL",
-            "Image URL",
-            "Brand",
-        ],
+        choices=ALL_FIELDS,
+        default=list(ALL_FIELDS),
         help="Fields to extract (default: all fields)",
     )
 
@@ -1574,21 +1597,27 @@ async def auto_retry_store_info(
         # Process in batches
         all_retry_results: dict[str, Any] = {}
 
-        for i in range(0, len(urls_to_retry), batch_size):
-            batch_urls: list[str] = urls_to_retry[i : i + batch_size]
+        try:
+            for i in range(0, len(urls_to_retry), batch_size):
+                batch_urls: list[str] = urls_to_retry[i : i + batch_size]
 
-            try:
-                batch_results = await integration.fetch_store_info_enhanced(batch_urls)
-                all_retry_results.update(batch_results)
+                try:
+                    batch_results = await integration.fetch_store_info_enhanced(
+                        batch_urls, defer_cache_flush=True
+                    )
+                    all_retry_results.update(batch_results)
 
-            except Exception:
-                pass  # Silent failure
+                except Exception:
+                    pass  # Silent failure
 
-            # Delay between batches
-            if i + batch_size < len(urls_to_retry) and delay > 0:
-                import asyncio
+                # Delay between batches
+                if i + batch_size < len(urls_to_retry) and delay > 0:
+                    import asyncio
 
-                await asyncio.sleep(delay)
+                    await asyncio.sleep(delay)
+        finally:
+            # Write the store info cache once for the whole retry run
+            await integration.flush_cache()
 
         # Update products with retry results
         updated_products: list[dict[str, Any]] = []
@@ -1647,86 +1676,88 @@ async def auto_retry_store_info(
         pass  # Silent failure
 
 
-def main():
-    """Main CLI entry point."""
-    logger = ScraperLogger("Core.Scraper")
+@dataclass(slots=True)
+class ScrapeConfig:
+    """Typed options for a single scrape run (mirrors the CLI flags)."""
+
+    keyword: str
+    brand: str
+    pages: int = 1
+    discount: bool = False
+    free_shipping: bool = False
+    min_price: float | None = None
+    max_price: float | None = None
+    delay: float = 1.0
+    fields: list[str] = field(default_factory=lambda: list(ALL_FIELDS))
+    proxy_provider: str = ""
+    enable_store_retry: bool = False
+    store_retry_batch_size: int = 5
+    store_retry_delay: float = 2.0
+    stream: bool = False
+    results_dir: str = RESULTS_DIR
+
+
+def run(config: ScrapeConfig) -> tuple[str | None, str | None]:
+    """
+    Run a scrape job from an already-built config (no argument parsing).
 
-    parser = create_parser()
-    args = parser.parse_args()
+    Returns the (json, csv) paths written, or None for files that were not saved.
+    """
+    logger = ScraperLogger("Core.Scraper")
 
     # Validate price range
-    if args.min_price is not None and args.max_price is not None:
-        if args.min_price > args.max_price:
-            parser.error("--min-price cannot be greater than --max-price")
+    if config.min_price is not None and config.max_price is not None:
+        if config.min_price > config.max_price:
+            raise ValueError("--min-price cannot be greater than --max-price")
 
-    logger.start("AliExpress scraper starting", f"keyword: '{args.keyword}'")
-    logger.config("Brand", args.brand)
-    logger.config("Pages to scrape", str(args.pages))
+    logger.start("AliExpress scraper starting", f"keyword: '{config.keyword}'")
+    logger.config("Brand", config.brand)
+    logger.config("Pages to scrape", str(config.pages))
 
-    if args.proxy_provider:
-        logger.config("Proxy provider", args.proxy_provider)
+    if config.proxy_provider:
+        logger.config("Proxy provider", config.proxy_provider)
     else:
         logger.config("Proxy provider", "None (direct connection)")
 
-    if args.discount:
+    if config.discount:
         logger.config("Big Sale discount filter", "ON")
-    if args.free_shipping:
+    if config.free_shipping:
         logger.config("Free shipping filter", "ON")
-    if args.min_price is not None:
-        logger.config("Min price", f"${args.min_price}")
-    if args.max_price is not None:
-        logger.config("Max price", f"${args.max_price}")
+    if config.min_price is not None:
+        logger.config("Min price", f"${config.min_price}")
+    if config.max_price is not None:
+        logger.config("Max price", f"${config.max_price}")
 
     print("=" * 50)
 
     try:
         # Validate proxy credentials if proxy provider is specified
-        if args.proxy_provider:
-            validate_proxy_credentials(args.proxy_provider)
+        if config.proxy_provider:
+            validate_proxy_credentials(config.proxy_provider)
 
         # Initialize session
         fresh_cookies, fresh_user_agent = initialize_session_data(
-            args.keyword, args.proxy_provider
+            config.keyword, config.proxy_provider
         )
 
-        # Helper: safe overwrite existing file by renaming old to .bakN
-        def ensure_safe_path(path: str) -> str:
-            if not os.path.exists(path):
-                return path
-            base, ext = os.path.splitext(path)
-            n = 1
-            while True:
-                candidate = f"{base}.bak{n}{ext}"
-                if not os.path.exists(candidate):
-                    try:
-                        os.rename(path, candidate)
-                    except Exception:
-                        pass
-                    return path
-                n += 1
-
         json_file: str | None = None
         csv_file: str | None = None
         extracted_products: list[dict[str, Any]] = []
 
-        if args.stream:
+        if config.stream:
             # Streaming mode: write JSONL and CSV row-by-row
-            brand_safe = (
-                "".join(c.lower() if c.isalnum() else "_" for c in args.brand)
-                if args.brand
-                else "unknown"
-            )
+            brand_safe = slugify(config.brand)
             date_str = datetime.datetime.now().strftime("%Y%m%d")
-            os.makedirs(RESULTS_DIR, exist_ok=True)
+            os.makedirs(config.results_dir, exist_ok=True)
             jsonl_path = os.path.join(
-                RESULTS_DIR, f"aliexpress_{brand_safe}_{date_str}.jsonl"
+                config.results_dir, f"aliexpress_{brand_safe}_{date_str}.jsonl"
             )
             csv_path = os.path.join(
-                RESULTS_DIR, f"aliexpress_{brand_safe}_{date_str}.csv"
+                config.results_dir, f"aliexpress_{brand_safe}_{date_str}.csv"
             )
 
-            jsonl_path = ensure_safe_path(jsonl_path)
-            csv_path = ensure_safe_path(csv_path)
+            backup_if_exists(jsonl_path)
+            backup_if_exists(csv_path)
 
             # Open writers
             with (
@@ -1734,7 +1765,7 @@ def main():
                 open(csv_path, "w", encoding="utf-8", newline="") as cf,
             ):
                 csv_writer = csv.DictWriter(
-                    cf, fieldnames=args.fields, extrasaction="ignore"
+                    cf, fieldnames=config.fields, extrasaction="ignore"
                 )
                 csv_writer.writeheader()
 
@@ -1744,9 +1775,9 @@ def main():
                     # Extract per-page with optional store info batch
                     extracted = extract_product_details(
                         items,
-                        args.fields,
-                        args.brand,
-                        args.proxy_provider,
+                        config.fields,
+                        config.brand,
+                        config.proxy_provider,
                         session=None,
                         fetch_store_info=False,
                         log_callback=print,
@@ -1759,16 +1790,16 @@ def main():
 
                 # Execute scraping with streaming callback; session is needed inside callback, so create initial session via a tiny pre-call
                 raw_products, session = scrape_aliexpress_data(
-                    keyword=args.keyword,
-                    max_pages=args.pages,
+                    keyword=config.keyword,
+                    max_pages=config.pages,
                     cookies=fresh_cookies,
                     user_agent=fresh_user_agent,
-                    proxy_provider=args.proxy_provider,
-                    apply_discount_filter=args.discount,
-                    apply_free_shipping_filter=args.free_shipping,
-                    min_price=args.min_price,
-                    max_price=args.max_price,
-                    delay=args.delay,
+                    proxy_provider=config.proxy_provider,
+                    apply_discount_filter=config.discount,
+                    apply_free_shipping_filter=config.free_shipping,
+                    min_price=config.min_price,
+                    max_price=config.max_price,
+                    delay=config.delay,
                     on_page=on_page,
                 )
 
@@ -1779,22 +1810,22 @@ def main():
         else:
             # Scrape data (non-streaming)
             raw_products, session = scrape_aliexpress_data(
-                keyword=args.keyword,
-                max_pages=args.pages,
+                keyword=config.keyword,
+                max_pages=config.pages,
                 cookies=fresh_cookies,
                 user_agent=fresh_user_agent,
-                proxy_provider=args.proxy_provider,
-                apply_discount_filter=args.discount,
-                apply_free_shipping_filter=args.free_shipping,
-                min_price=args.min_price,
-                max_price=args.max_price,
-                delay=args.delay,
+                proxy_provider=config.proxy_provider,
+                apply_discount_filter=config.discount,
+                apply_free_shipping_filter=config.free_shipping,
+                min_price=config.min_price,
+                max_price=config.max_price,
+                delay=config.delay,
             )
 
         # Non-streaming: enrich and save
-        if not args.stream:
+        if not config.stream:
             store_fields_requested = any(
-                field in args.fields
+                field in config.fields
                 for field in ["Store Name", "Store ID", "Store URL"]
             )
             if store_fields_requested:
@@ -1802,20 +1833,24 @@ def main():
             # Extract product details
             extracted_products = extract_product_details(
                 raw_products,
-                args.fields,
-                args.brand,
-                args.proxy_provider,
+                config.fields,
+                config.brand,
+                config.proxy_provider,
                 session=session,
                 fetch_store_info=store_fields_requested,
             )
 
             # Save results
             json_file, csv_file = save_results(
-                args.keyword, extracted_products, args.fields, args.brand
+                config.keyword,
+                extracted_products,
+                config.fields,
+                config.brand,
+                results_dir=config.results_dir,
             )
 
         # Auto-retry store information if enabled
-        if args.enable_store_retry:
+        if config.enable_store_retry:
             import asyncio
 
             logger.process(
@@ -1829,9 +1864,9 @@ def main():
                         auto_retry_store_info(
                             json_file=json_file,
                             products=extracted_products,
-                            proxy_provider=args.proxy_provider,
-                            batch_size=args.store_retry_batch_size,
-                            delay=args.store_retry_delay,
+                            proxy_provider=config.proxy_provider,
+                            batch_size=config.store_retry_batch_size,
+                            delay=config.store_retry_delay,
                         )
                     )
             except Exception as e:
@@ -1839,7 +1874,7 @@ def main():
 
         logger.success("Scraping completed successfully!")
         total_count = len(extracted_products)
-        if args.stream and total_count == 0:
+        if config.stream and total_count == 0:
             logger.info("Total products extracted: (streaming mode)")
         else:
             logger.info("Total products extracted", str(total_count))
@@ -1847,13 +1882,45 @@ def main():
             logger.info("JSON file", json_file)
         if csv_file:
             logger.info("CSV file", csv_file)
+        return json_file, csv_file
 
     except KeyboardInterrupt:
         logger.warning("Scraping interrupted by user")
+        return None, None
     except Exception as e:
         logger.error("Error during scraping", str(e))
         raise
 
 
+def main():
+    """Main CLI entry point."""
+    parser = create_parser()
+    args = parser.parse_args()
+
+    # Validate price range
+    if args.min_price is not None and args.max_price is not None:
+        if args.min_price > args.max_price:
+            parser.error("--min-price cannot be greater than --max-price")
+
+    run(
+        ScrapeConfig(
+            keyword=args.keyword,
+            brand=args.brand,
+            pages=args.pages,
+            discount=args.discount,
+            free_shipping=args.free_shipping,
+            min_price=args.min_price,
+            max_price=args.max_price,
+            delay=args.delay,
+            fields=args.fields,
+            proxy_provider=args.proxy_provider,
+            enable_store_retry=args.enable_store_retry,
+            store_retry_batch_size=args.store_retry_batch_size,
+            store_retry_delay=args.store_retry_delay,
+            stream=args.stream,
+        )
+    )
+
+
 if __name__ == "__main__":
     main()
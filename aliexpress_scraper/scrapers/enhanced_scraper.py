@@ -17,45 +17,50 @@ Features:
 
 import argparse
 import asyncio
+import concurrent.futures
+import contextlib
 import csv
 import datetime
-import json
 import os
 import time
+from itertools import islice
 from typing import Any, Callable, cast
 from urllib.parse import quote_plus
 
-from ..core.captcha_solver import CaptchaSolverContext, CaptchaSolverIntegration
+from ..core.captcha_solver import CaptchaSolverIntegration, CaptchaSolverPool
+from ..core.fields import ALL_FIELDS
 from ..core.scraper import (
     CACHE_EXPIRATION_SECONDS,
     OXYLABS_ENDPOINT,
     OXYLABS_PASSWORD,
     OXYLABS_USERNAME,
+    RESULTS_DIR,
     SESSION_CACHE_FILE,
+    backup_if_exists,
     default_logger,
+    extract_product_details,
     initialize_session_data,
+    save_results,
     scrape_aliexpress_data,
+    slugify,
     validate_proxy_credentials,
 )
+from ..utils import json_io
+
+# Products between progress lines when solving captchas for large batches
+_PROGRESS_LOG_INTERVAL = 50
 
-# Import enhanced store scraper integration
-try:
-    from ..store.store_integration import (
-        enhance_existing_scraper_with_store_integration,
-    )
 
-    # Apply the enhanced store integration to existing scraper functions
-    enhance_existing_scraper_with_store_integration()
-    pass  # Silent integration
-except ImportError as e:
-    print(f"⚠️ Enhanced store integration not available: {e}")
-except Exception as e:
-    print(f"❌ Error applying store integration: {e}")
+def _silent_logger(message: str) -> None:
+    """Log callback used when logging is disabled"""
 
 
 class EnhancedAliExpressScraper:
     """Enhanced scraper with captcha solving capabilities"""
 
+    # Store integration patches core.scraper globally, so apply it at most once
+    _store_integration_applied = False
+
     def __init__(
         self,
         proxy_provider: str = "",
@@ -64,7 +69,8 @@ class EnhancedAliExpressScraper:
         enable_store_retry: bool = False,
         store_retry_batch_size: int = 5,
         store_retry_delay: float = 2.0,
-        log_callback: Callable[[str], None] = default_logger,
+        captcha_solver_concurrency: int = 4,
+        log_callback: Callable[[str], None] | None = default_logger,
     ):
         """
         Initialize enhanced scraper
@@ -76,7 +82,8 @@ class EnhancedAliExpressScraper:
             enable_store_retry: Legacy parameter - store extraction is disabled
             store_retry_batch_size: Legacy parameter - store extraction is disabled
             store_retry_delay: Legacy parameter - store extraction is disabled
-            log_callback: Logging function
+            captcha_solver_concurrency: Browsers solving product captchas at once
+            log_callback: Logging function, or None to disable logging
         """
         self.proxy_provider = proxy_provider
         self.enable_captcha_solver = enable_captcha_solver
@@ -84,8 +91,36 @@ class EnhancedAliExpressScraper:
         self.enable_store_retry = enable_store_retry
         self.store_retry_batch_size = store_retry_batch_size
         self.store_retry_delay = store_retry_delay
-        self.log_callback = log_callback
+        self.captcha_solver_concurrency = captcha_solver_concurrency
+        # Per-page and per-item progress messages are only formatted when enabled
+        self._log_enabled = log_callback is not None
+        self.log_callback = log_callback or _silent_logger
         self.proxy_config = self._get_proxy_config()
+        # Last session cache read or written, keyed by the file's mtime
+        self._session_cache: tuple[int, dict[str, Any]] | None = None
+        # Search URLs by keyword, reused across retry attempts
+        self._search_urls: dict[str, str] = {}
+
+        if enable_store_retry:
+            self._apply_store_integration()
+
+    @classmethod
+    def _apply_store_integration(cls) -> None:
+        """Patch the core scraper with the enhanced store integration on first use"""
+        if cls._store_integration_applied:
+            return
+        cls._store_integration_applied = True
+        try:
+            from ..store.store_integration import (
+                enhance_existing_scraper_with_store_integration,
+            )
+
+            # Apply the enhanced store integration to existing scraper functions
+            enhance_existing_scraper_with_store_integration()
+        except ImportError as e:
+            print(f"⚠️ Enhanced store integration not available: {e}")
+        except Exception as e:
+            print(f"❌ Error applying store integration: {e}")
 
     def _get_proxy_config(self) -> dict[str, str] | None:
         """Get proxy configuration for captcha solver"""
@@ -131,10 +166,8 @@ class EnhancedAliExpressScraper:
             self.log_callback(
                 "⚠️  Captcha solver disabled - using standard session initialization"
             )
-            # Run the sync function in executor to avoid asyncio loop conflict
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(
-                None,
+            # Run the sync function in a worker thread to keep the event loop free
+            return await asyncio.to_thread(
                 initialize_session_data,
                 keyword,
                 self.proxy_provider,
@@ -142,7 +175,11 @@ class EnhancedAliExpressScraper:
             )
 
         # Use captcha solver for session initialization
-        search_url = f"https://www.aliexpress.us/w/wholesale-{quote_plus(keyword)}.html"
+        search_url = self._search_urls.get(keyword)
+        if search_url is None:
+            search_url = self._search_urls[keyword] = (
+                f"https://www.aliexpress.us/w/wholesale-{quote_plus(keyword)}.html"
+            )
         self.log_callback(f"🔗 Target URL: {search_url}")
 
         try:
@@ -175,10 +212,8 @@ class EnhancedAliExpressScraper:
                 self.log_callback(
                     "⚠️  Captcha solver failed - falling back to standard method"
                 )
-                # Run the sync function in executor to avoid asyncio loop conflict
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(
-                    None,
+                # Run the sync function in a worker thread to keep the event loop free
+                return await asyncio.to_thread(
                     initialize_session_data,
                     keyword,
                     self.proxy_provider,
@@ -188,10 +223,8 @@ class EnhancedAliExpressScraper:
         except Exception as e:
             self.log_callback(f"❌ Captcha solver initialization error: {str(e)}")
             self.log_callback("🔄 Falling back to standard session initialization")
-            # Run the sync function in executor to avoid asyncio loop conflict
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(
-                None,
+            # Run the sync function in a worker thread to keep the event loop free
+            return await asyncio.to_thread(
                 initialize_session_data,
                 keyword,
                 self.proxy_provider,
@@ -200,13 +233,20 @@ class EnhancedAliExpressScraper:
 
     def _check_cache(self) -> dict[str, Any] | None:
         """Check for valid cached session data"""
-        if not os.path.exists(SESSION_CACHE_FILE):
+        try:
+            mtime_ns = os.stat(SESSION_CACHE_FILE).st_mtime_ns
+        except FileNotFoundError:
             self.log_callback("📁 No session cache file found")
             return None
 
         try:
-            with open(SESSION_CACHE_FILE, "r") as f:
-                cached_data = json.load(f)
+            # Only re-parse the file when it changed since we last saw it
+            if self._session_cache and self._session_cache[0] == mtime_ns:
+                cached_data = self._session_cache[1]
+            else:
+                with open(SESSION_CACHE_FILE, "rb") as f:
+                    cached_data = json_io.loads(f.read())
+                self._session_cache = (mtime_ns, cached_data)
 
             saved_timestamp = cached_data.get("timestamp", 0)
             current_timestamp = time.time()
@@ -222,7 +262,7 @@ class EnhancedAliExpressScraper:
                     f"⏰ Session cache expired (age: {int(cache_age)}s, max: {CACHE_EXPIRATION_SECONDS}s)"
                 )
 
-        except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
+        except (json_io.JSONDecodeError, FileNotFoundError, KeyError) as e:
             self.log_callback(f"⚠️  Error reading session cache: {e}")
 
         return None
@@ -236,8 +276,12 @@ class EnhancedAliExpressScraper:
                 "user_agent": user_agent,
             }
 
-            with open(SESSION_CACHE_FILE, "w") as f:
-                json.dump(cache_content, f, indent=4)
+            with open(SESSION_CACHE_FILE, "wb") as f:
+                f.write(json_io.dumps(cache_content, indent=True))
+            self._session_cache = (
+                os.stat(SESSION_CACHE_FILE).st_mtime_ns,
+                cache_content,
+            )
 
             self.log_callback(
                 f"💾 Session data cached successfully ({len(cookies)} cookies)"
@@ -310,33 +354,12 @@ class EnhancedAliExpressScraper:
                     f"📦 Retrieved {len(raw_products)} raw products from API"
                 )
 
-                # Use the original scraper's detailed extraction function
-                from ..core.scraper import extract_product_details
-
-                # Define all available fields that can be extracted
-                all_fields = [
-                    "Product ID",
-                    "Title",
-                    "Sale Price",
-                    "Original Price",
-                    "Discount (%)",
-                    "Currency",
-                    "Rating",
-                    "Orders Count",
-                    "Store Name",
-                    "Store ID",
-                    "Store URL",
-                    "Product URL",
-                    "Image URL",
-                    "Brand",
-                ]
-
                 self.log_callback("🏗️  Extracting detailed product information...")
 
                 # Extract detailed product information (store info disabled)
                 extracted_products = extract_product_details(
                     raw_products=raw_products,
-                    selected_fields=all_fields,
+                    selected_fields=list(ALL_FIELDS),
                     brand=brand,  # Use the provided brand parameter
                     proxy_provider=self.proxy_provider,
                     session=session,
@@ -396,16 +419,17 @@ class EnhancedAliExpressScraper:
             self.log_callback("⚠️  No products found in results")
             return False
 
-        # Check if products have essential fields
-        valid_count = 0
-        for product in products[:3]:  # Check first 3 products
-            if not isinstance(product, dict):
-                continue
-            product_dict = cast(dict[str, Any], product)
-            if product_dict.get("Title") or product_dict.get("title"):
-                valid_count += 1
+        # Check if any of the first 3 products has essential fields
+        has_valid = any(
+            isinstance(product, dict)
+            and (
+                cast(dict[str, Any], product).get("Title")
+                or cast(dict[str, Any], product).get("title")
+            )
+            for product in islice(products, 3)
+        )
 
-        if valid_count == 0:
+        if not has_valid:
             self.log_callback("⚠️  No valid products found (missing titles)")
             return False
 
@@ -439,52 +463,13 @@ class EnhancedAliExpressScraper:
             f"📊 Configuration: {max_pages} pages, streaming: {stream}, save: {save_to_file}"
         )
 
-        # Common fields for extraction/saving
-        all_fields = [
-            "Product ID",
-            "Title",
-            "Sale Price",
-            "Original Price",
-            "Discount (%)",
-            "Currency",
-            "Rating",
-            "Orders Count",
-            "Store Name",
-            "Store ID",
-            "Store URL",
-            "Product URL",
-            "Image URL",
-            "Brand",
-        ]
-
         if stream:
             self.log_callback("🌊 Starting streaming mode scraper...")
             # Streaming mode: produce a JSON array incrementally + CSV row-by-row
-            from ..core.scraper import RESULTS_DIR, extract_product_details
-
-            # Safe path helper (backup existing files)
-            def ensure_safe_path(path: str) -> str:
-                if not os.path.exists(path):
-                    return path
-                base, ext = os.path.splitext(path)
-                n = 1
-                while True:
-                    candidate = f"{base}.bak{n}{ext}"
-                    if not os.path.exists(candidate):
-                        try:
-                            os.rename(path, candidate)
-                        except Exception:
-                            pass
-                        return path
-                    n += 1
 
             # Stable file names (no timestamps) per keyword + date
             # For streaming mode, use keyword to avoid overwriting between queries
-            keyword_safe = (
-                "".join(c.lower() if c.isalnum() else "_" for c in keyword)
-                if keyword
-                else "unknown"
-            )
+            keyword_safe = slugify(keyword)
             date_str = datetime.datetime.now().strftime("%Y%m%d")
             os.makedirs(RESULTS_DIR, exist_ok=True)
             json_path = os.path.join(
@@ -493,11 +478,16 @@ class EnhancedAliExpressScraper:
             csv_path = os.path.join(
                 RESULTS_DIR, f"aliexpress_{keyword_safe}_{date_str}.csv"
             )
-            json_path = ensure_safe_path(json_path)
-            csv_path = ensure_safe_path(csv_path)
+            # One product per line, so multi-query merges can stream it back
+            jsonl_path = os.path.join(
+                RESULTS_DIR, f"aliexpress_{keyword_safe}_{date_str}.jsonl"
+            )
+            backup_if_exists(json_path)
+            backup_if_exists(csv_path)
+            backup_if_exists(jsonl_path)
 
             self.log_callback(
-                f"📁 Output files: JSON={os.path.basename(json_path)}, CSV={os.path.basename(csv_path)}"
+                f"📁 Output files: JSON={os.path.basename(json_path)}, CSV={os.path.basename(csv_path)}, JSONL={os.path.basename(jsonl_path)}"
             )
 
             # Initialize session (captcha-aware)
@@ -507,57 +497,85 @@ class EnhancedAliExpressScraper:
             )
 
             total_written = 0
-            first_row = True
 
-            # We write '[' then objects separated by commas, then ']' at end
+            def open_stream_files() -> tuple[contextlib.ExitStack, Any, Any, Any]:
+                with contextlib.ExitStack() as stack:
+                    jf = stack.enter_context(open(json_path, "wb"))
+                    cf = stack.enter_context(
+                        open(csv_path, "w", encoding="utf-8", newline="")
+                    )
+                    lf = stack.enter_context(open(jsonl_path, "wb"))
+                    return stack.pop_all(), jf, cf, lf
+
+            # '[' goes out with the first page and ']' with the final close.
+            # Files are opened and closed off the event loop
             self.log_callback("📝 Starting streaming data write...")
-            with (
-                open(json_path, "w", encoding="utf-8") as jf,
-                open(csv_path, "w", encoding="utf-8", newline="") as cf,
-            ):
-                jf.write("[\n")
-                csv_writer = csv.DictWriter(
-                    cf, fieldnames=all_fields, extrasaction="ignore"
+            stream_files, jf, cf, lf = await asyncio.to_thread(open_stream_files)
+            try:
+                csv_writer = csv.writer(cf)
+                csv_writer.writerow(ALL_FIELDS)
+
+                def write_page(page_num: int, extracted: list[dict[str, Any]]) -> None:
+                    nonlocal total_written
+                    # Serialize each row once and write the page in one go
+                    rows_json = [json_io.dumps(row) for row in extracted]
+                    if rows_json:
+                        # Opening bracket or separator goes out in the same write
+                        jf.write(
+                            (b",\n" if total_written else b"[\n")
+                            + b",\n".join(rows_json)
+                        )
+                        lf.write(b"\n".join(rows_json) + b"\n")
+                    # Project rows onto the header columns and write them in one call
+                    csv_writer.writerows(
+                        [row.get(field, "") for field in ALL_FIELDS]
+                        for row in extracted
+                    )
+                    total_written += len(rows_json)
+                    cf.flush()
+                    jf.flush()
+                    lf.flush()
+                    if self._log_enabled:
+                        self.log_callback(
+                            f"📄 Page {page_num}: Wrote {len(extracted)} products to files"
+                        )
+
+                # Pages are written on their own thread, in order, so the
+                # fetching thread moves on to the next page instead of waiting
+                # on disk writes and flushes
+                writer = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="stream-writer"
                 )
-                csv_writer.writeheader()
+                pending_writes: list[concurrent.futures.Future[None]] = []
 
                 def on_page(page_num: int, items: list[dict[str, Any]]) -> None:
-                    nonlocal total_written, first_row
                     if not items:
-                        self.log_callback(f"📄 Page {page_num}: No items found")
+                        if self._log_enabled:
+                            self.log_callback(f"📄 Page {page_num}: No items found")
                         return
 
-                    self.log_callback(
-                        f"📄 Page {page_num}: Processing {len(items)} items..."
-                    )
+                    if self._log_enabled:
+                        self.log_callback(
+                            f"📄 Page {page_num}: Processing {len(items)} items..."
+                        )
                     extracted = extract_product_details(
                         items,
-                        all_fields,
+                        list(ALL_FIELDS),
                         brand,
                         self.proxy_provider,
                         session=None,
                         fetch_store_info=False,  # Avoid extra requests while streaming
                         log_callback=self.log_callback,
                     )
-                    for row in extracted:
-                        # JSON array punctuation management
-                        if not first_row:
-                            jf.write(",\n")
-                        jf.write(json.dumps(row, ensure_ascii=False))
-                        first_row = False
-                        csv_writer.writerow(row)
-                        total_written += 1
-                    cf.flush()
-                    jf.flush()
-                    self.log_callback(
-                        f"📄 Page {page_num}: Wrote {len(extracted)} products to files"
+                    pending_writes.append(
+                        writer.submit(write_page, page_num, extracted)
                     )
 
-                # Run underlying scrape in executor (keeps event loop free)
+                # Run underlying scrape in a worker thread (keeps event loop free)
                 self.log_callback("⚡ Starting parallel page fetching...")
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: scrape_aliexpress_data(
+                try:
+                    await asyncio.to_thread(
+                        scrape_aliexpress_data,
                         keyword=keyword,
                         max_pages=max_pages,
                         cookies=cookies,
@@ -574,11 +592,20 @@ class EnhancedAliExpressScraper:
                         delay=kwargs.get("delay", 1.0),
                         log_callback=self.log_callback,
                         on_page=on_page,
-                    ),
-                )
+                    )
+
+                    # Wait for queued page writes; re-raises any write error
+                    await asyncio.gather(*map(asyncio.wrap_future, pending_writes))
+                finally:
+                    # Shutting down waits for pending writes, so keep it off the loop
+                    await asyncio.to_thread(writer.shutdown, wait=True)
 
                 # Close JSON array
-                jf.write("\n]\n")
+                await asyncio.to_thread(
+                    jf.write, b"\n]\n" if total_written else b"[]\n"
+                )
+            finally:
+                await asyncio.to_thread(stream_files.close)
 
             self.log_callback(
                 f"✅ Streaming completed: {total_written} products written to files"
@@ -587,6 +614,7 @@ class EnhancedAliExpressScraper:
                 "products": [],  # Not held in memory
                 "json_file": json_path,
                 "csv_file": csv_path,
+                "jsonl_file": jsonl_path,
                 "total_streamed": total_written,
                 "stream": True,
             }
@@ -606,14 +634,13 @@ class EnhancedAliExpressScraper:
 
         if save_to_file and products:
             self.log_callback("💾 Saving results to files...")
-            from ..core.scraper import RESULTS_DIR, save_results
 
             os.makedirs(RESULTS_DIR, exist_ok=True)
 
             json_file, csv_file = save_results(
                 keyword=keyword,
                 data=products,
-                selected_fields=all_fields,
+                selected_fields=list(ALL_FIELDS),
                 brand=brand,
                 log_callback=self.log_callback,
             )
@@ -636,193 +663,16 @@ class EnhancedAliExpressScraper:
 
         return results
 
-    async def _auto_retry_store_info(
-        self, json_file: str, products: list[dict[str, Any]]
-    ) -> None:
-        """
-        Automatically retry missing store information and update the saved file.
-
-        Args:
-            json_file: Path to the saved JSON file
-            products: List of scraped products
-        """
-        try:
-            # Import the store retry functionality
-            from ..store.store_integration import get_store_integration
-
-            self.log_callback("🔍 Analyzing products for missing store information...")
-
-            # Analyze products for missing store info
-            missing_products: list[dict[str, Any]] = []
-            for product in products:
-                store_name = product.get("Store Name")
-                store_id = product.get("Store ID")
-                store_url = product.get("Store URL")
-                product_url = product.get("Product URL")
-
-                # Check if store information is missing
-                needs_retry = False
-                if not store_name or store_name in [None, "null", "", "N/A"]:
-                    needs_retry = True
-                if not store_id or store_id in [None, "null", "", "N/A"]:
-                    needs_retry = True
-                if not store_url or store_url in [None, "null", "", "N/A"]:
-                    needs_retry = True
-
-                if needs_retry and product_url:
-                    missing_products.append(product)
-
-            if not missing_products:
-                self.log_callback(
-                    "✅ All products already have complete store information"
-                )
-                return
-
-            self.log_callback(
-                f"🔄 Found {len(missing_products)} products needing store info retry"
-            )
-
-            # Extract URLs for retry with explicit typing
-            urls_to_retry: list[str] = [
-                p["Product URL"] for p in missing_products if p.get("Product URL")
-            ]
-
-            if not urls_to_retry:
-                self.log_callback("⚠️  No valid product URLs found for retry")
-                return
-
-            self.log_callback(
-                f"🏪 Retrying store info for {len(urls_to_retry)} products..."
-            )
-
-            # Get store integration and retry
-            integration = get_store_integration(proxy_provider=self.proxy_provider)
-
-            # Process in batches
-            all_retry_results: dict[str, Any] = {}
-            total_batches = (
-                len(urls_to_retry) + self.store_retry_batch_size - 1
-            ) // self.store_retry_batch_size
-
-            for i in range(0, len(urls_to_retry), self.store_retry_batch_size):
-                batch_num = (i // self.store_retry_batch_size) + 1
-                batch_urls: list[str] = urls_to_retry[
-                    i : i + self.store_retry_batch_size
-                ]
-
-                self.log_callback(
-                    f"📦 Processing batch {batch_num}/{total_batches} ({len(batch_urls)} URLs)..."
-                )
-
-                try:
-                    batch_results = await integration.fetch_store_info_enhanced(
-                        batch_urls
-                    )
-                    all_retry_results.update(batch_results)
-                    self.log_callback(f"✅ Batch {batch_num} completed successfully")
-
-                except Exception as e:
-                    self.log_callback(f"⚠️  Batch {batch_num} failed: {str(e)}")
-
-                # Delay between batches
-                if (
-                    i + self.store_retry_batch_size < len(urls_to_retry)
-                    and self.store_retry_delay > 0
-                ):
-                    self.log_callback(
-                        f"⏳ Waiting {self.store_retry_delay}s before next batch..."
-                    )
-                    await asyncio.sleep(self.store_retry_delay)
-
-            # Update products with retry results
-            self.log_callback("🔄 Updating products with retry results...")
-            updated_products: list[dict[str, Any]] = []
-            successful_updates = 0
-
-            for product in products:
-                product_url = product.get("Product URL")
-
-                if product_url in all_retry_results:
-                    store_info: dict[str, Any] = all_retry_results[product_url]
-
-                    updated_product = product.copy()
-                    updated = False
-
-                    if store_info.get("store_name"):
-                        updated_product["Store Name"] = store_info["store_name"]
-                        updated = True
-
-                    if store_info.get("store_id"):
-                        updated_product["Store ID"] = store_info["store_id"]
-                        updated = True
-
-                    if store_info.get("store_url"):
-                        updated_product["Store URL"] = store_info["store_url"]
-                        updated = True
-
-                    if updated:
-                        successful_updates += 1
-                        # Add retry metadata
-                        updated_product["_auto_retry_info"] = {
-                            "retry_successful": True,
-                            "retry_timestamp": time.time(),
-                            "retrieved_store_name": store_info.get("store_name"),
-                        }
-
-                    updated_products.append(updated_product)
-                else:
-                    updated_products.append(product)
-
-            # Save updated results if there were successful updates
-            if successful_updates > 0:
-                self.log_callback(
-                    f"💾 Updating files with {successful_updates} enhanced products..."
-                )
-                # Update the JSON file with new data
-                import json
-
-                with open(json_file, "w", encoding="utf-8") as f:
-                    json.dump(updated_products, f, indent=2, ensure_ascii=False)
-
-                # Also update CSV if we have it
-                csv_file = json_file.replace(".json", ".csv")
-                if csv_file != json_file:  # Make sure we actually have a CSV path
-                    try:
-                        import pandas as pd
-
-                        df = pd.DataFrame(updated_products)
-                        df.to_csv(csv_file, index=False)
-                        self.log_callback(
-                            "✅ Both JSON and CSV files updated successfully"
-                        )
-                    except ImportError:
-                        self.log_callback(
-                            "⚠️  CSV update skipped (pandas not available)"
-                        )
-                    except Exception:
-                        self.log_callback("⚠️  CSV update failed")
-                else:
-                    self.log_callback("✅ JSON file updated successfully")
-            else:
-                self.log_callback(
-                    "ℹ️  No store information could be retrieved for any products"
-                )
-
-        except ImportError:
-            self.log_callback(
-                "⚠️  Store integration not available - skipping auto-retry"
-            )
-        except Exception as e:
-            self.log_callback(f"⚠️  Auto-retry failed: {str(e)}")
-
     async def solve_captcha_for_product_details(
-        self, product_urls: list[str]
+        self, product_urls: list[str], pool: CaptchaSolverPool | None = None
     ) -> dict[str, dict[str, Any]]:
         """
         Solve captchas for product detail pages and extract session data
 
         Args:
             product_urls: List of product URLs to process
+            pool: Solver pool to reuse browsers from; a temporary one is
+                created and closed when omitted
 
         Returns:
             Dictionary mapping URLs to session data
@@ -838,32 +688,67 @@ class EnhancedAliExpressScraper:
         )
 
         results: dict[str, dict[str, Any]] = {}
+        total = len(product_urls)
+        pending: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+        for item in enumerate(product_urls, 1):
+            pending.put_nowait(item)
+
+        async def solve_pending(solver_pool: CaptchaSolverPool) -> None:
+            # A solver drives a single page, so each worker gets its own browser
+            solver = await solver_pool.acquire()
+            try:
+                while not pending.empty():
+                    i, url = pending.get_nowait()
+                    try:
+                        # Large batches report progress every few products only;
+                        # failures are always logged
+                        log_progress = self._log_enabled and (
+                            total <= _PROGRESS_LOG_INTERVAL
+                            or i % _PROGRESS_LOG_INTERVAL == 0
+                            or i == total
+                        )
+                        if log_progress:
+                            self.log_callback(
+                                f"🔍 Processing product {i}/{total}: {url[:50]}..."
+                            )
 
-        async with CaptchaSolverContext(
-            headless=self.captcha_solver_headless, proxy_config=self.proxy_config
-        ) as solver:
-            for i, url in enumerate(product_urls, 1):
-                try:
-                    self.log_callback(
-                        f"🔍 Processing product {i}/{len(product_urls)}: {url[:50]}..."
-                    )
-
-                    success, session_data = await solver.solve_captcha_on_url(
-                        url, max_attempts=3
-                    )
-
-                    if success:
-                        results[url] = session_data
-                        self.log_callback(f"✅ Product {i} captcha solved successfully")
-                    else:
-                        self.log_callback(f"⚠️  Product {i} captcha solving failed")
-
-                    # Small delay between products
-                    if i < len(product_urls):
-                        await asyncio.sleep(2)
+                        success, session_data = await solver.solve_captcha_on_url(
+                            url, max_attempts=3
+                        )
 
-                except Exception as e:
-                    self.log_callback(f"❌ Error processing product {i}: {str(e)}")
+                        if success:
+                            results[url] = session_data
+                            if log_progress:
+                                self.log_callback(
+                                    f"✅ Product {i} captcha solved successfully"
+                                )
+                        else:
+                            self.log_callback(f"⚠️  Product {i} captcha solving failed")
+
+                        # Small delay before this browser takes the next product;
+                        # the other workers keep solving in the meantime
+                        if not pending.empty():
+                            await asyncio.sleep(2)
+
+                    except Exception as e:
+                        self.log_callback(f"❌ Error processing product {i}: {str(e)}")
+            finally:
+                await solver_pool.release(solver)
+
+        if product_urls:
+            workers = max(1, min(self.captcha_solver_concurrency, total))
+            # Without a caller-provided pool the browsers only live for this call
+            owns_pool = pool is None
+            solver_pool = pool or CaptchaSolverPool(
+                headless=self.captcha_solver_headless, proxy_config=self.proxy_config
+            )
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for _ in range(workers):
+                        group.create_task(solve_pending(solver_pool))
+            finally:
+                if owns_pool:
+                    await solver_pool.close()
 
         success_rate = (len(results) / len(product_urls) * 100) if product_urls else 0
         self.log_callback(
@@ -886,7 +771,7 @@ async def enhanced_scrape_aliexpress(
     max_price: float | None = None,
     delay: float = 1.0,
     max_retries: int = 3,
-    log_callback: Callable[[str], None] = default_logger,
+    log_callback: Callable[[str], None] | None = default_logger,
 ) -> dict[str, Any]:
     """
     Enhanced scraping function with captcha solving
@@ -918,7 +803,8 @@ async def solve_captcha_for_urls(
     urls: list[str],
     proxy_provider: str = "",
     headless: bool = True,
-    log_callback: Callable[[str], None] = default_logger,
+    log_callback: Callable[[str], None] | None = default_logger,
+    pool: CaptchaSolverPool | None = None,
 ) -> dict[str, dict[str, Any]]:
     """
     Solve captchas for a list of URLs and return session data
@@ -928,6 +814,9 @@ async def solve_captcha_for_urls(
         proxy_provider: Proxy provider to use
         headless: Whether to run browser in headless mode
         log_callback: Logging function
+        pool: Solver pool to reuse across calls, e.g. one opened with
+            ``async with CaptchaSolverPool(...)``; without it the browsers are
+            closed before this returns
 
     Returns:
         Dictionary mapping URLs to session data
@@ -939,7 +828,7 @@ async def solve_captcha_for_urls(
         log_callback=log_callback,
     )
 
-    return await scraper.solve_captcha_for_product_details(urls)
+    return await scraper.solve_captcha_for_product_details(urls, pool=pool)
 
 
 if __name__ == "__main__":
@@ -20,6 +20,184 @@ from .scraper_interface import (
 
 logger = logging.getLogger(__name__)
 
+# Page scripts, built once instead of per call
+
+# Hides images and disables stylesheets in the current page
+_BANDWIDTH_OPTIMIZATION_JS = """
+() => {
+    // Disable image loading
+    const originalCreateElement = document.createElement;
+    document.createElement = function(tagName) {
+        const element = originalCreateElement.call(document, tagName);
+        if (tagName.toLowerCase() === 'img') {
+            element.style.display = 'none';
+        }
+        return element;
+    };
+
+    // Block CSS loading by overriding link element creation
+    const originalCreateElementNS = document.createElementNS;
+    document.createElementNS = function(namespaceURI, qualifiedName) {
+        const element = originalCreateElementNS.call(document, namespaceURI, qualifiedName);
+        if (qualifiedName.toLowerCase() === 'link') {
+            element.addEventListener('load', function() {
+                if (this.rel && this.rel.toLowerCase() === 'stylesheet') {
+                    this.disabled = true;
+                }
+            });
+        }
+        return element;
+    };
+
+    // Set flag to indicate optimization was applied
+    window._bandwidthOptimized = true;
+}
+"""
+
+# Store name via the primary XPath on the product page
+_XPATH_EXTRACT_JS = """
+() => {
+    const element = document.evaluate(
+        '//*[@id="root"]/div/div[1]/div/div[2]/div/div/a/div[2]',
+        document,
+        null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE,
+        null
+    ).singleNodeValue;
+
+    if (element) {
+        const storeNameText = element.textContent?.trim();
+
+        // Try to extract store ID from URL
+        const storeLink = element.closest('a')?.href;
+        let storeId = null;
+        let storeUrl = null;
+
+        if (storeLink) {
+            const storeIdMatch = storeLink.match(/store\\/([0-9]+)/);
+            if (storeIdMatch) {
+                storeId = storeIdMatch[1];
+                storeUrl = storeLink;
+            }
+        }
+
+        return {
+            store_name: storeNameText,
+            store_id: storeId,
+            store_url: storeUrl,
+            found: true
+        };
+    }
+
+    return { found: false };
+}
+"""
+
+# Store name via common store/seller CSS selectors
+_CSS_EXTRACT_JS = """
+() => {
+    // Try various CSS selectors for store information
+    const selectors = [
+        '[data-pl="store-name"]',
+        '.store-name',
+        '.seller-name',
+        '[class*="store"]',
+        '[class*="seller"]'
+    ];
+
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (element) {
+            const storeNameText = element.textContent?.trim();
+            if (storeNameText) {
+                // Try to find store link
+                const storeLink = element.closest('a')?.href ||
+                                document.querySelector('a[href*="/store/"]')?.href;
+
+                let storeId = null;
+                let storeUrl = null;
+
+                if (storeLink) {
+                    const storeIdMatch = storeLink.match(/store\\/([0-9]+)/);
+                    if (storeIdMatch) {
+                        storeId = storeIdMatch[1];
+                        storeUrl = storeLink;
+                    }
+                }
+
+                return {
+                    store_name: storeNameText,
+                    store_id: storeId,
+                    store_url: storeUrl,
+                    found: true,
+                    selector: selector
+                };
+            }
+        }
+    }
+
+    return { found: false };
+}
+"""
+
+# Store name via store links and breadcrumbs
+_ALTERNATIVE_EXTRACT_JS = """
+() => {
+    // Try to find store information in various ways
+
+    // Method 1: Look for store links in the page
+    const storeLinks = document.querySelectorAll('a[href*="/store/"]');
+    for (const link of storeLinks) {
+        const text = link.textContent?.trim();
+        if (text && text.length > 0) {
+            const storeIdMatch = link.href.match(/store\\/([0-9]+)/);
+            if (storeIdMatch) {
+                return {
+                    store_name: text,
+                    store_id: storeIdMatch[1],
+                    store_url: link.href,
+                    found: true,
+                    method: 'store_link'
+                };
+            }
+        }
+    }
+
+    // Method 2: Look for seller information in breadcrumbs or headers
+    const breadcrumbSelectors = [
+        '.breadcrumb a',
+        '[class*="breadcrumb"] a',
+        'nav a',
+        '.seller-info',
+        '.store-info'
+    ];
+
+    for (const selector of breadcrumbSelectors) {
+        const elements = document.querySelectorAll(selector);
+        for (const element of elements) {
+            const text = element.textContent?.trim();
+            if (text && (text.includes('Store') || text.includes('Shop'))) {
+                const href = element.href;
+                if (href && href.includes('/store/')) {
+                    const storeIdMatch = href.match(/store\\/([0-9]+)/);
+                    if (storeIdMatch) {
+                        return {
+                            store_name: text,
+                            store_id: storeIdMatch[1],
+                            store_url: href,
+                            found: true,
+                            method: 'breadcrumb'
+                        };
+                    }
+                }
+            }
+        }
+    }
+
+    return { found: false };
+}
+"""
+
 
 @register_store_scraper(StoreScrapingMethod.MCP_PLAYWRIGHT)
 class MCPPlaywrightStoreScraper(StoreScraperInterface):
@@ -166,43 +344,35 @@ class MCPPlaywrightStoreScraper(StoreScraperInterface):
 
         results: dict[str, StoreInfo] = {}
 
-        # Process URLs with controlled concurrency
+        # Process URLs with controlled concurrency: batch_size workers pull from
+        # one queue, so a slow page never holds up the others
         batch_size = kwargs.get("batch_size", 5)
         delay_between_batches = kwargs.get("delay_between_batches", 2.0)
-
-        for i in range(0, len(product_urls), batch_size):
-            batch = product_urls[i : i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (len(product_urls) + batch_size - 1) // batch_size
-
-            logger.info(
-                f"📦 Processing batch {batch_num}/{total_batches} ({len(batch)} URLs)"
-            )
-
-            # Process batch concurrently
-            batch_tasks = [self.scrape_single_store(url, **kwargs) for url in batch]
-
-            batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-
-            # Collect results
-            for url, result in zip(batch, batch_results):
-                if isinstance(result, Exception):
-                    logger.error(f"❌ Error processing {url}: {result}")
+        pending: asyncio.Queue[str] = asyncio.Queue()
+        for url in product_urls:
+            pending.put_nowait(url)
+
+        async def scrape_pending() -> None:
+            while not pending.empty():
+                url = pending.get_nowait()
+                try:
+                    results[url] = await self.scrape_single_store(url, **kwargs)
+                except Exception as e:
+                    logger.error(f"❌ Error processing {url}: {e}")
                     results[url] = StoreInfo(
                         source_url=url,
-                        error=str(result),
+                        error=str(e),
                         extraction_method="mcp_playwright_batch_error",
                     )
-                else:
-                    # Type assertion: result is StoreInfo here after isinstance check
-                    results[url] = cast(StoreInfo, result)
 
-            # Delay between batches to avoid overwhelming the server
-            if i + batch_size < len(product_urls):
-                logger.debug(
-                    f"⏳ Waiting {delay_between_batches}s before next batch..."
-                )
-                await asyncio.sleep(delay_between_batches)
+                # Pace each worker to avoid overwhelming the server
+                if not pending.empty() and delay_between_batches > 0:
+                    await asyncio.sleep(delay_between_batches)
+
+        workers = max(1, min(batch_size, len(product_urls)))
+        async with asyncio.TaskGroup() as group:
+            for _ in range(workers):
+                group.create_task(scrape_pending())
 
         successful_count = sum(1 for result in results.values() if result.is_valid)
         logger.info(
@@ -225,38 +395,8 @@ class MCPPlaywrightStoreScraper(StoreScraperInterface):
 
         try:
             # Method 1: Inject JavaScript to disable images and CSS
-            js_optimization = """
-            // Disable image loading
-            const originalCreateElement = document.createElement;
-            document.createElement = function(tagName) {
-                const element = originalCreateElement.call(document, tagName);
-                if (tagName.toLowerCase() === 'img') {
-                    element.style.display = 'none';
-                }
-                return element;
-            };
-            
-            // Block CSS loading by overriding link element creation
-            const originalCreateElementNS = document.createElementNS;
-            document.createElementNS = function(namespaceURI, qualifiedName) {
-                const element = originalCreateElementNS.call(document, namespaceURI, qualifiedName);
-                if (qualifiedName.toLowerCase() === 'link') {
-                    element.addEventListener('load', function() {
-                        if (this.rel && this.rel.toLowerCase() === 'stylesheet') {
-                            this.disabled = true;
-                        }
-                    });
-                }
-                return element;
-            };
-            
-            // Set flag to indicate optimization was applied
-            window._bandwidthOptimized = true;
-            """
-
-            # Use MCP evaluate to inject the optimization script
             await mcp_playwright_browser_evaluate(  # type: ignore
-                function=f"() => {{ {js_optimization} }}"
+                function=_BANDWIDTH_OPTIMIZATION_JS
             )
 
             # Simulate bandwidth tracking (for statistics)
@@ -349,48 +489,7 @@ class MCPPlaywrightStoreScraper(StoreScraperInterface):
     async def _extract_store_name_with_xpath(self, product_url: str) -> StoreInfo:
         """Extract store name using the primary XPath selector"""
         try:
-            # Use the specified XPath for store name extraction
-            xpath_selector = '//*[@id="root"]/div/div[1]/div/div[2]/div/div/a/div[2]'
-
-            js_code = f"""
-            () => {{
-                const element = document.evaluate(
-                    '{xpath_selector}',
-                    document,
-                    null,
-                    XPathResult.FIRST_ORDERED_NODE_TYPE,
-                    null
-                ).singleNodeValue;
-                
-                if (element) {{
-                    const storeNameText = element.textContent?.trim();
-                    
-                    // Try to extract store ID from URL
-                    const storeLink = element.closest('a')?.href;
-                    let storeId = null;
-                    let storeUrl = null;
-                    
-                    if (storeLink) {{
-                        const storeIdMatch = storeLink.match(/store\\/([0-9]+)/);
-                        if (storeIdMatch) {{
-                            storeId = storeIdMatch[1];
-                            storeUrl = storeLink;
-                        }}
-                    }}
-                    
-                    return {{
-                        store_name: storeNameText,
-                        store_id: storeId,
-                        store_url: storeUrl,
-                        found: true
-                    }};
-                }}
-                
-                return {{ found: false }};
-            }}
-            """
-
-            result = await mcp_playwright_browser_evaluate(function=js_code)  # type: ignore
+            result = await mcp_playwright_browser_evaluate(function=_XPATH_EXTRACT_JS)  # type: ignore
 
             # Type hint for result from MCP evaluate
             result_dict = cast(dict[str, Any], result) if result else {}
@@ -421,53 +520,7 @@ class MCPPlaywrightStoreScraper(StoreScraperInterface):
     async def _extract_store_name_with_css(self, product_url: str) -> StoreInfo:
         """Extract store name using CSS selectors as fallback"""
         try:
-            js_code = """
-            () => {
-                // Try various CSS selectors for store information
-                const selectors = [
-                    '[data-pl="store-name"]',
-                    '.store-name',
-                    '.seller-name',
-                    '[class*="store"]',
-                    '[class*="seller"]'
-                ];
-                
-                for (const selector of selectors) {
-                    const element = document.querySelector(selector);
-                    if (element) {
-                        const storeNameText = element.textContent?.trim();
-                        if (storeNameText) {
-                            // Try to find store link
-                            const storeLink = element.closest('a')?.href || 
-                                            document.querySelector('a[href*="/store/"]')?.href;
-                            
-                            let storeId = null;
-                            let storeUrl = null;
-                            
-                            if (storeLink) {
-                                const storeIdMatch = storeLink.match(/store\\/([0-9]+)/);
-                                if (storeIdMatch) {
-                                    storeId = storeIdMatch[1];
-                                    storeUrl = storeLink;
-                                }
-                            }
-                            
-                            return {
-                                store_name: storeNameText,
-                                store_id: storeId,
-                                store_url: storeUrl,
-                                found: true,
-                                selector: selector
-                            };
-                        }
-                    }
-                }
-                
-                return { found: false };
-            }
-            """
-
-            result = await mcp_playwright_browser_evaluate(function=js_code)  # type: ignore
+            result = await mcp_playwright_browser_evaluate(function=_CSS_EXTRACT_JS)  # type: ignore
 
             # Type hint for result from MCP evaluate
             result_dict = cast(dict[str, Any], result) if result else {}
@@ -501,64 +554,9 @@ class MCPPlaywrightStoreScraper(StoreScraperInterface):
     async def _extract_store_name_alternative(self, product_url: str) -> StoreInfo:
         """Extract store name using alternative methods"""
         try:
-            js_code = """
-            () => {
-                // Try to find store information in various ways
-                
-                // Method 1: Look for store links in the page
-                const storeLinks = document.querySelectorAll('a[href*="/store/"]');
-                for (const link of storeLinks) {
-                    const text = link.textContent?.trim();
-                    if (text && text.length > 0) {
-                        const storeIdMatch = link.href.match(/store\\/([0-9]+)/);
-                        if (storeIdMatch) {
-                            return {
-                                store_name: text,
-                                store_id: storeIdMatch[1],
-                                store_url: link.href,
-                                found: true,
-                                method: 'store_link'
-                            };
-                        }
-                    }
-                }
-                
-                // Method 2: Look for seller information in breadcrumbs or headers
-                const breadcrumbSelectors = [
-                    '.breadcrumb a',
-                    '[class*="breadcrumb"] a',
-                    'nav a',
-                    '.seller-info',
-                    '.store-info'
-                ];
-                
-                for (const selector of breadcrumbSelectors) {
-                    const elements = document.querySelectorAll(selector);
-                    for (const element of elements) {
-                        const text = element.textContent?.trim();
-                        if (text && (text.includes('Store') || text.includes('Shop'))) {
-                            const href = element.href;
-                            if (href && href.includes('/store/')) {
-                                const storeIdMatch = href.match(/store\\/([0-9]+)/);
-                                if (storeIdMatch) {
-                                    return {
-                                        store_name: text,
-                                        store_id: storeIdMatch[1],
-                                        store_url: href,
-                                        found: true,
-                                        method: 'breadcrumb'
-                                    };
-                                }
-                            }
-                        }
-                    }
-                }
-                
-                return { found: false };
-            }
-            """
-
-            result = await mcp_playwright_browser_evaluate(function=js_code)  # type: ignore
+            result = await mcp_playwright_browser_evaluate(  # type: ignore
+                function=_ALTERNATIVE_EXTRACT_JS
+            )
 
             # Type hint for result from MCP evaluate
             result_dict = cast(dict[str, Any], result) if result else {}
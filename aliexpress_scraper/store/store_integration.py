@@ -9,8 +9,18 @@ seamless backwards compatibility while adding new capabilities.
 """
 
 import asyncio
+import builtins
+import functools
 import logging
-from typing import Any, Callable
+import os
+import threading
+import time
+from itertools import batched
+from typing import Any, AsyncIterator, Callable, Coroutine, Iterable
+from urllib.parse import urlsplit
+
+from ..core.fields import MISSING_VALUES, build_product_url
+from ..utils import json_io
 
 # Import implementations to register them
 # These imports are required for the decorators to execute and register the scrapers
@@ -28,6 +38,57 @@ from .scraper_interface import (
 
 logger = logging.getLogger(__name__)
 
+# Function injected by the MCP Playwright extension when it is available
+_MCP_NAVIGATE_FUNCTION = "mcp_playwright_browser_navigate"
+
+# On-disk cache of resolved store info, keyed by product URL
+STORE_INFO_CACHE_FILE = os.path.join("results", "cache", "store_info_cache.json")
+STORE_INFO_CACHE_SECONDS = 24 * 60 * 60
+# Failed lookups expire sooner so transient errors are retried
+STORE_INFO_MISS_CACHE_SECONDS = 10 * 60
+
+# Store info reported for products whose store could not be resolved
+_EMPTY_STORE_INFO: dict[str, str | None] = {
+    "store_name": None,
+    "store_id": None,
+    "store_url": None,
+}
+
+
+# The scraper manager's fallback chain is global, so it is set up only once
+_fallback_chain_ready = False
+
+
+def _ensure_fallback_chain() -> None:
+    """Install the default fallback chain on first use"""
+    global _fallback_chain_ready
+    if not _fallback_chain_ready:
+        setup_default_fallback_chain()
+        _fallback_chain_ready = True
+
+
+@functools.lru_cache(maxsize=8)
+def _build_proxy_config(proxy_provider: str) -> dict[str, Any]:
+    """Proxy settings for a provider, read from the environment once"""
+    config: dict[str, Any] = {}
+
+    if proxy_provider == "oxylabs":
+        username = os.getenv("OXYLABS_USERNAME")
+        password = os.getenv("OXYLABS_PASSWORD")
+        endpoint = os.getenv("OXYLABS_ENDPOINT", "pr.oxylabs.io:7777")
+
+        if username and password:
+            config.update(
+                {
+                    "use_oxylabs_proxy": True,
+                    "proxy_username": username,
+                    "proxy_password": password,
+                    "proxy_endpoint": endpoint,
+                }
+            )
+
+    return config
+
 
 class EnhancedStoreInfoIntegration:
     """
@@ -54,40 +115,103 @@ class EnhancedStoreInfoIntegration:
         self.log_callback = log_callback or self._default_logger
 
         # Setup default fallback chain
-        setup_default_fallback_chain()
+        _ensure_fallback_chain()
 
         # Configure proxy settings
         self.proxy_config = self._get_proxy_config()
 
+        # Cached store info by product URL: (expires_at, info); loaded on first use
+        self._cache: dict[str, tuple[float, dict[str, str | None]]] | None = None
+        # Guards the cache dict, which is shared with the _run_sync loop thread
+        self._cache_lock = threading.Lock()
+        # Serializes writes of the cache file
+        self._cache_file_lock = threading.Lock()
+        # Set when the cache holds entries not yet written to disk
+        self._cache_dirty = False
+
     def _default_logger(self, message: str) -> None:
         """Default logging function"""
         logger.debug(message)
 
     def _get_proxy_config(self) -> dict[str, Any]:
         """Get proxy configuration"""
-        config: dict[str, Any] = {}
-
-        if self.proxy_provider == "oxylabs":
-            import os
-
-            username = os.getenv("OXYLABS_USERNAME")
-            password = os.getenv("OXYLABS_PASSWORD")
-            endpoint = os.getenv("OXYLABS_ENDPOINT", "pr.oxylabs.io:7777")
-
-            if username and password:
-                config.update(
-                    {
-                        "use_oxylabs_proxy": True,
-                        "proxy_username": username,
-                        "proxy_password": password,
-                        "proxy_endpoint": endpoint,
-                    }
-                )
+        # Copy so callers cannot mutate the cached settings
+        return dict(_build_proxy_config(self.proxy_provider))
+
+    @staticmethod
+    def _cache_key(product_url: str) -> str:
+        """Product URL without query string or fragment (tracking parameters)"""
+        parts = urlsplit(product_url)
+        return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+    def _load_cache(self) -> dict[str, tuple[float, dict[str, str | None]]]:
+        """Return the store info cache, reading unexpired entries from disk once"""
+        with self._cache_lock:
+            if self._cache is None:
+                self._cache = self._read_cache_file()
+            return self._cache
+
+    def _read_cache_file(self) -> dict[str, tuple[float, dict[str, str | None]]]:
+        """Read the unexpired entries of the on-disk store info cache"""
+        cache: dict[str, tuple[float, dict[str, str | None]]] = {}
+        try:
+            with open(STORE_INFO_CACHE_FILE, "rb") as f:
+                entries = json_io.loads(f.read())
+            now = time.time()
+            for key, (expires_at, info) in entries.items():
+                if expires_at > now:
+                    cache[key] = (expires_at, info)
+        except FileNotFoundError:
+            pass
+        except (
+            json_io.JSONDecodeError,
+            AttributeError,
+            TypeError,
+            ValueError,
+        ) as e:
+            self.log_callback(f"⚠️  Ignoring unreadable store info cache: {e}")
+        return cache
+
+    def _write_cache_file(
+        self, snapshot: dict[str, tuple[float, dict[str, str | None]]]
+    ) -> None:
+        """Write a snapshot of the store info cache to disk"""
+        with self._cache_file_lock:
+            os.makedirs(os.path.dirname(STORE_INFO_CACHE_FILE), exist_ok=True)
+            tmp_path = STORE_INFO_CACHE_FILE + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(json_io.dumps(snapshot))
+            os.replace(tmp_path, STORE_INFO_CACHE_FILE)
+
+    async def flush_cache(self) -> None:
+        """
+        Write the store info cache to disk if it has unsaved entries.
 
-        return config
+        Callers running many fetches with defer_cache_flush=True call this once
+        when they are done, so the file is rewritten once per run, not per batch.
+        """
+        cache = self._load_cache()
+        with self._cache_lock:
+            if not self._cache_dirty:
+                return
+            snapshot = dict(cache)
+            self._cache_dirty = False
+        try:
+            await asyncio.to_thread(self._write_cache_file, snapshot)
+        except Exception as e:
+            # The cache is an optimization; never fail the fetch over it
+            with self._cache_lock:
+                self._cache_dirty = True
+            self.log_callback(f"⚠️  Failed to save store info cache: {e}")
 
     async def fetch_store_info_enhanced(
-        self, product_urls: list[str], **kwargs: Any
+        self,
+        product_urls: list[str],
+        *,
+        urls_per_batch: int = 32,
+        max_concurrent_batches: int = 4,
+        defer_cache_flush: bool = False,
+        **kwargs: Any,
     ) -> dict[str, dict[str, str | None]]:
         """
         Enhanced store info fetching using the new framework.
@@ -97,6 +221,9 @@ class EnhancedStoreInfoIntegration:
 
         Args:
             product_urls: list of product URLs to scrape
+            urls_per_batch: URLs handed to the scraper manager per call
+            max_concurrent_batches: Batches allowed in flight at once
+            defer_cache_flush: Leave new cache entries for a later flush_cache()
             **kwargs: Additional configuration options
 
         Returns:
@@ -105,47 +232,98 @@ class EnhancedStoreInfoIntegration:
         if not product_urls:
             return {}
 
-        # Merge proxy config with kwargs
-        scraping_config = {**self.proxy_config, **kwargs}
+        # Each URL is looked up once, however often it appears
+        unique_urls = list(dict.fromkeys(product_urls))
+        if len(unique_urls) < len(product_urls):
+            self.log_callback(
+                f"🔁 Skipping {len(product_urls) - len(unique_urls)} duplicate product URLs"
+            )
 
-        try:
-            # Use the dependency injection framework
-            store_results = (
-                await store_scraper_manager.scrape_multiple_stores_with_fallback(
-                    product_urls=product_urls,
-                    preferred_method=self.preferred_method,
-                    **scraping_config,
-                )
+        # Serve URLs resolved recently from the cache; scrape only the rest
+        cache = self._load_cache()
+        now = time.time()
+        legacy_format_results: dict[str, dict[str, str | None]] = {}
+        urls_to_scrape: list[str] = []
+        with self._cache_lock:
+            for url in unique_urls:
+                entry = cache.get(self._cache_key(url))
+                if entry and entry[0] > now:
+                    legacy_format_results[url] = dict(entry[1])
+                else:
+                    urls_to_scrape.append(url)
+
+        if not urls_to_scrape:
+            self.log_callback(
+                f"💾 Store info served from cache for all {len(unique_urls)} products"
             )
+            return legacy_format_results
 
-            # Convert to the format expected by existing code
-            legacy_format_results: dict[str, dict[str, str | None]] = {}
+        # Merge proxy config with kwargs
+        scraping_config = {**self.proxy_config, **kwargs}
 
-            for url, store_info in store_results.items():
-                legacy_format_results[url] = {
-                    "store_name": store_info.store_name,
-                    "store_id": store_info.store_id,
-                    "store_url": store_info.store_url,
-                }
+        # Dispatch the URLs in batches, a few at a time, so one slow batch does
+        # not hold up the rest and a failure only loses its own batch
+        batches = list(batched(urls_to_scrape, urls_per_batch))
+        semaphore = asyncio.Semaphore(max(1, max_concurrent_batches))
 
-            successful_count = sum(
-                1
-                for result in legacy_format_results.values()
-                if result.get("store_name")
-            )
+        async def scrape_batch(batch_num: int, batch_urls: tuple[str, ...]) -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    # Use the dependency injection framework
+                    store_results = await store_scraper_manager.scrape_multiple_stores_with_fallback(
+                        product_urls=list(batch_urls),
+                        preferred_method=self.preferred_method,
+                        **scraping_config,
+                    )
+                except Exception as e:
+                    # Return empty results for the URLs that failed
+                    self.log_callback(f"⚠️  Store batch {batch_num} failed: {e}")
+                    for url in batch_urls:
+                        legacy_format_results[url] = dict(_EMPTY_STORE_INFO)
+                    return
+
+                self.log_callback(
+                    f"📦 Store batch {batch_num}/{len(batches)}: {len(batch_urls)} URLs "
+                    f"in {time.perf_counter() - started:.1f}s"
+                )
 
-            self.log_callback(
-                f"✅ Enhanced store info fetch complete: {successful_count}/{len(product_urls)} successful"
+                # Convert to the format expected by existing code
+                now = time.time()
+                for url, store_info in store_results.items():
+                    info: dict[str, str | None] = {
+                        "store_name": store_info.store_name,
+                        "store_id": store_info.store_id,
+                        "store_url": store_info.store_url,
+                    }
+                    legacy_format_results[url] = info
+                    ttl = (
+                        STORE_INFO_CACHE_SECONDS
+                        if info["store_name"]
+                        else STORE_INFO_MISS_CACHE_SECONDS
+                    )
+                    with self._cache_lock:
+                        cache[self._cache_key(url)] = (now + ttl, dict(info))
+                        self._cache_dirty = True
+
+        await asyncio.gather(
+            *(
+                scrape_batch(batch_num, batch_urls)
+                for batch_num, batch_urls in enumerate(batches, 1)
             )
+        )
+        if not defer_cache_flush:
+            await self.flush_cache()
 
-            return legacy_format_results
+        successful_count = sum(
+            1 for result in legacy_format_results.values() if result.get("store_name")
+        )
 
-        except Exception:
-            # Return empty results in case of failure
-            return {
-                url: {"store_name": None, "store_id": None, "store_url": None}
-                for url in product_urls
-            }
+        self.log_callback(
+            f"✅ Enhanced store info fetch complete: {successful_count}/{len(unique_urls)} successful"
+        )
+
+        return legacy_format_results
 
     async def fetch_single_store_info(
         self, product_url: str, **kwargs: Any
@@ -161,14 +339,50 @@ class EnhancedStoreInfoIntegration:
             Dictionary with store information
         """
         results = await self.fetch_store_info_enhanced([product_url], **kwargs)
-        return results.get(
-            product_url, {"store_name": None, "store_id": None, "store_url": None}
-        )
+        return results.get(product_url) or dict(_EMPTY_STORE_INFO)
+
+
+def _mcp_functions_available() -> bool:
+    """
+    Check whether the MCP Playwright functions can be called.
+
+    The MCP scraper looks them up as globals of its module, so they resolve
+    only when injected there or into builtins.
+    """
+    return hasattr(builtins, _MCP_NAVIGATE_FUNCTION) or hasattr(
+        mcp_store_scraper, _MCP_NAVIGATE_FUNCTION
+    )
 
 
 # Global integration instance
 _store_integration: EnhancedStoreInfoIntegration | None = None
 
+# Event loop for running store coroutines from synchronous code; started on
+# first use and kept for the life of the process
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = threading.Lock()
+
+
+def _run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine on the background event loop and wait for its result.
+
+    Works whether or not the calling thread already has a running loop, without
+    creating a new loop or thread per call.
+    """
+    global _background_loop
+
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever,
+                name="store-integration-loop",
+                daemon=True,
+            ).start()
+
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop).result()
+
 
 def get_store_integration(
     proxy_provider: str = "", log_callback: Callable[[str], None] | None = None
@@ -186,24 +400,13 @@ def get_store_integration(
     global _store_integration
 
     if _store_integration is None:
-        # Determine preferred method based on environment
-        preferred_method = None
-        try:
-            # Try to detect if MCP functions are available
-            import inspect
-
-            frame = inspect.currentframe()
-            while frame:
-                if "mcp_playwright_browser_navigate" in frame.f_globals:
-                    preferred_method = StoreScrapingMethod.MCP_PLAYWRIGHT
-                    break
-                frame = frame.f_back
-        except:
-            pass
-
-        if preferred_method is None:
-            # Default to traditional Playwright
-            preferred_method = StoreScrapingMethod.TRADITIONAL_PLAYWRIGHT
+        # Determine preferred method based on environment, defaulting to
+        # traditional Playwright when the MCP functions are not available
+        preferred_method = (
+            StoreScrapingMethod.MCP_PLAYWRIGHT
+            if _mcp_functions_available()
+            else StoreScrapingMethod.TRADITIONAL_PLAYWRIGHT
+        )
 
         _store_integration = EnhancedStoreInfoIntegration(
             preferred_method=preferred_method,
@@ -220,6 +423,7 @@ def enhance_existing_scraper_with_store_integration():
 
     This function modifies the existing fetch_store_info_batch and related functions
     to use the new dependency injection framework while maintaining compatibility.
+    It is not applied on import; callers that need the patch call it explicitly.
     """
     try:
         # Import existing scraper modules
@@ -240,67 +444,29 @@ def enhance_existing_scraper_with_store_integration():
                 """
                 Enhanced replacement for fetch_store_info_batch that uses async methods
                 """
-                # Convert product IDs to URLs
-                product_urls = [
-                    f"https://www.aliexpress.com/item/{product_id}.html"
+                # Convert product IDs to URLs, keeping the mapping for the results
+                id_to_url = {
+                    product_id: build_product_url(product_id)
                     for product_id in product_ids
                     if product_id
-                ]
-
-                # Run the async method
-                loop = None
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-
-                if loop.is_running():
-                    # If we're already in an async context, we need to handle this differently
-                    # Create a new event loop in a thread
-                    import concurrent.futures
-
-                    def run_in_thread():
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        try:
-                            return new_loop.run_until_complete(
-                                integration_instance.fetch_store_info_enhanced(
-                                    product_urls,
-                                    proxy_provider=proxy_provider,
-                                    max_workers=max_workers,
-                                )
-                            )
-                        finally:
-                            new_loop.close()
-
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(run_in_thread)
-                        results = future.result()
-                else:
-                    results = loop.run_until_complete(
-                        integration_instance.fetch_store_info_enhanced(
-                            product_urls,
-                            proxy_provider=proxy_provider,
-                            max_workers=max_workers,
-                        )
+                }
+                product_urls = list(id_to_url.values())
+
+                # Run the async method on the shared background loop
+                results = _run_sync(
+                    integration_instance.fetch_store_info_enhanced(
+                        product_urls,
+                        proxy_provider=proxy_provider,
+                        max_workers=max_workers,
                     )
+                )
 
                 # Convert URL-based results back to product ID-based results
                 final_results: dict[str, dict[str, Any]] = {}
-                for i, product_id in enumerate(product_ids):
-                    if i < len(product_urls):
-                        url = product_urls[i]
-                        final_results[product_id] = results.get(
-                            url,
-                            {"store_name": None, "store_id": None, "store_url": None},
-                        )
-                    else:
-                        final_results[product_id] = {
-                            "store_name": None,
-                            "store_id": None,
-                            "store_url": None,
-                        }
+                for product_id in product_ids:
+                    url = id_to_url.get(product_id)
+                    store_info = results.get(url) if url else None
+                    final_results[product_id] = store_info or dict(_EMPTY_STORE_INFO)
 
                 return final_results
 
@@ -342,50 +508,126 @@ async def scrape_stores_for_products(
         **kwargs: Additional scraping parameters
 
     Returns:
-        list of products enhanced with store information
+        list of products enhanced with store information; products that were
+        not updated are the input dicts themselves, not copies
     """
     if not products:
         return []
 
-    # Extract URLs
+    # Extract URLs, skipping products that already have store info; each URL
+    # is scraped once even if several products share it
     product_urls: list[str] = []
+    has_urls = False
     for product in products:
         url = product.get(url_field)
         if url:
-            product_urls.append(url)
+            has_urls = True
+            if not product.get("store_name"):
+                product_urls.append(url)
 
-    if not product_urls:
+    if not has_urls:
         logger.warning("No valid URLs found in products")
         return products
 
+    if not product_urls:
+        return products
+
     # Get integration instance
     integration = get_store_integration(proxy_provider=proxy_provider)
 
     # Scrape store information
-    store_results = await integration.fetch_store_info_enhanced(product_urls, **kwargs)
+    store_results = await integration.fetch_store_info_enhanced(
+        list(dict.fromkeys(product_urls)), **kwargs
+    )
 
-    # Enhance products with store information
+    # Enhance products with store information; updated products are new dicts,
+    # the rest are passed through as the same objects
     enhanced_products: list[dict[str, Any]] = []
     for product in products:
-        enhanced_product = product.copy()
         url = product.get(url_field)
+        store_info = store_results.get(url) if url else None
+
+        if (
+            store_info
+            and store_info.get("store_name")
+            and not product.get("store_name")
+        ):
+            product = {
+                **product,
+                "store_name": store_info["store_name"],
+                "store_id": store_info["store_id"],
+                "store_url": store_info["store_url"],
+            }
 
-        if url and url in store_results:
-            store_info = store_results[url]
-            if store_info.get("store_name"):
-                enhanced_product.update(
-                    {
-                        "store_name": store_info["store_name"],
-                        "store_id": store_info["store_id"],
-                        "store_url": store_info["store_url"],
-                    }
-                )
-
-        enhanced_products.append(enhanced_product)
+        enhanced_products.append(product)
 
     return enhanced_products
 
 
+async def stream_stores_for_products(
+    products: Iterable[dict[str, Any]],
+    url_field: str = "url",
+    proxy_provider: str = "",
+    batch_size: int = 20,
+    **kwargs: Any,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Stream products enhanced with store information, one batch at a time
+
+    Unlike scrape_stores_for_products, products are updated in place and
+    yielded as soon as their batch resolves, so callers can write them out
+    without holding the whole result set in memory.
+
+    Args:
+        products: Products to enhance; any iterable, including a generator
+        url_field: Field name containing the product URL
+        proxy_provider: Proxy provider to use
+        batch_size: Products looked up per store info request
+        **kwargs: Additional scraping parameters
+
+    Yields:
+        Each input product, in order, with store information filled in
+    """
+    integration = get_store_integration(proxy_provider=proxy_provider)
+
+    try:
+        for batch in batched(products, batch_size):
+            # Only products with a URL and no store info need a lookup
+            product_urls = list(
+                dict.fromkeys(
+                    url
+                    for product in batch
+                    if (url := product.get(url_field)) and not product.get("store_name")
+                )
+            )
+            store_results = (
+                await integration.fetch_store_info_enhanced(
+                    product_urls, defer_cache_flush=True, **kwargs
+                )
+                if product_urls
+                else {}
+            )
+
+            for product in batch:
+                store_info = store_results.get(product.get(url_field) or "")
+                if (
+                    store_info
+                    and store_info.get("store_name")
+                    and not product.get("store_name")
+                ):
+                    product.update(
+                        {
+                            "store_name": store_info["store_name"],
+                            "store_id": store_info["store_id"],
+                            "store_url": store_info["store_url"],
+                        }
+                    )
+                yield product
+    finally:
+        # Write the store info cache once for the whole stream
+        await integration.flush_cache()
+
+
 def configure_store_scraping_method(method: StoreScrapingMethod) -> None:
     """
     Configure the preferred store scraping method globally
@@ -415,127 +657,151 @@ def list_available_store_methods() -> list[str]:
     return [method.value for method in available_methods]
 
 
-def retry_missing_store_info(
+async def retry_missing_store_info_async(
     products: list[dict[str, Any]],
     proxy_provider: str = "",
     batch_size: int = 5,
     delay: float = 2.0,
+    max_concurrent_batches: int = 3,
+    batch_timeout: float | None = None,
 ) -> list[dict[str, Any]]:
     """
-    Simple function to retry missing store information for products
+    Retry missing store information for products
 
     Args:
         products: list of product dictionaries
         proxy_provider: Proxy provider to use
         batch_size: Batch size for processing
-        delay: Delay between batches
+        delay: Delay before a batch slot takes the next batch
+        max_concurrent_batches: Batches allowed in flight at once
+        batch_timeout: Seconds before a batch is abandoned (None to wait)
 
     Returns:
         list of products with updated store information
     """
-    import asyncio
-
-    # Remove unused time import
-
-    async def _async_retry():
-        # Find products with missing store info
-        missing_products: list[dict[str, Any]] = []
-        for product in products:
-            store_name = product.get("Store Name")
-            product_url = product.get("Product URL")
-
-            if (
-                not store_name or store_name in [None, "null", "", "N/A"]
-            ) and product_url:
-                missing_products.append(product)
+    # Find products with missing store info
+    missing_products: list[dict[str, Any]] = []
+    for product in products:
+        store_name = product.get("Store Name")
+        product_url = product.get("Product URL")
 
-        if not missing_products:
-            return products
+        if (not store_name or store_name in MISSING_VALUES) and product_url:
+            missing_products.append(product)
 
-        # Extract URLs for retry with explicit typing
-        urls_to_retry: list[str] = [
-            p["Product URL"] for p in missing_products if p.get("Product URL")
-        ]
+    if not missing_products:
+        return products
 
-        if not urls_to_retry:
-            return products
+    # Extract URLs for retry with explicit typing
+    urls_to_retry: list[str] = [
+        p["Product URL"] for p in missing_products if p.get("Product URL")
+    ]
 
-        # Get integration and retry silently
-        integration = get_store_integration(proxy_provider=proxy_provider)
+    if not urls_to_retry:
+        return products
 
-        # Process in batches
-        all_retry_results: dict[str, Any] = {}
+    # Get integration and retry silently
+    integration = get_store_integration(proxy_provider=proxy_provider)
 
-        for i in range(0, len(urls_to_retry), batch_size):
-            batch_urls: list[str] = urls_to_retry[i : i + batch_size]
+    # Process batches concurrently; the semaphore bounds how many are
+    # in flight and each slot is held through its post-batch delay
+    batches = list(batched(urls_to_retry, batch_size))
+    semaphore = asyncio.Semaphore(max(1, max_concurrent_batches))
 
+    async def run_batch(
+        batch_num: int, batch_urls: tuple[str, ...]
+    ) -> dict[str, dict[str, str | None]]:
+        async with semaphore:
+            # Failed or timed-out batches are skipped; cancellation propagates
+            # straight away instead of waiting out the delay
             try:
-                batch_results = await integration.fetch_store_info_enhanced(batch_urls)
-                all_retry_results.update(batch_results)
-            except:
-                pass  # Silent failure
-
-            # Delay between batches
-            if i + batch_size < len(urls_to_retry) and delay > 0:
+                async with asyncio.timeout(batch_timeout):
+                    batch_results = await integration.fetch_store_info_enhanced(
+                        list(batch_urls), defer_cache_flush=True
+                    )
+            except TimeoutError:
+                logger.warning(f"Store retry batch {batch_num} timed out")
+                batch_results = {}
+            except Exception as e:
+                logger.warning(f"Store retry batch {batch_num} failed: {e}")
+                batch_results = {}
+
+            # Delay before this slot takes the next batch
+            if batch_num < len(batches) and delay > 0:
                 await asyncio.sleep(delay)
+            return batch_results
 
-        # Update products with retry results
-        updated_products: list[dict[str, Any]] = []
+    # An unexpected error cancels the sibling batches instead of letting
+    # them run to completion
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(run_batch(batch_num, batch_urls))
+                for batch_num, batch_urls in enumerate(batches, 1)
+            ]
+    finally:
+        # Write the cache once for the whole run
+        await integration.flush_cache()
+
+    all_retry_results: dict[str, Any] = {}
+    for task in tasks:
+        all_retry_results.update(task.result())
+
+    # Update products with retry results
+    updated_products: list[dict[str, Any]] = []
 
-        for product in products:
-            product_url = product.get("Product URL")
+    for product in products:
+        product_url = product.get("Product URL")
 
-            if product_url in all_retry_results:
-                store_info: dict[str, Any] = all_retry_results[product_url]
-                updated_product = product.copy()
+        if product_url in all_retry_results:
+            store_info: dict[str, Any] = all_retry_results[product_url]
+            updated_product = product.copy()
 
-                if store_info.get("store_name"):
-                    updated_product["Store Name"] = store_info["store_name"]
+            if store_info.get("store_name"):
+                updated_product["Store Name"] = store_info["store_name"]
 
-                if store_info.get("store_id"):
-                    updated_product["Store ID"] = store_info["store_id"]
+            if store_info.get("store_id"):
+                updated_product["Store ID"] = store_info["store_id"]
 
-                if store_info.get("store_url"):
-                    updated_product["Store URL"] = store_info["store_url"]
+            if store_info.get("store_url"):
+                updated_product["Store URL"] = store_info["store_url"]
 
-                updated_products.append(updated_product)
-            else:
-                updated_products.append(product)
+            updated_products.append(updated_product)
+        else:
+            updated_products.append(product)
 
-        return updated_products
+    return updated_products
 
-    # Run async function
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If we're in an async context, create new thread
-            import concurrent.futures
-
-            def run_in_thread():
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    return new_loop.run_until_complete(_async_retry())
-                finally:
-                    new_loop.close()
 
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(run_in_thread)
-                return future.result()
-        else:
-            return loop.run_until_complete(_async_retry())
-    except RuntimeError:
-        # No event loop, create new one
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(_async_retry())
-        finally:
-            loop.close()
+def retry_missing_store_info(
+    products: list[dict[str, Any]],
+    proxy_provider: str = "",
+    batch_size: int = 5,
+    delay: float = 2.0,
+    max_concurrent_batches: int = 3,
+    batch_timeout: float | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Synchronous wrapper around retry_missing_store_info_async for non-async callers
 
+    Args:
+        products: list of product dictionaries
+        proxy_provider: Proxy provider to use
+        batch_size: Batch size for processing
+        delay: Delay before a batch slot takes the next batch
+        max_concurrent_batches: Batches allowed in flight at once
+        batch_timeout: Seconds before a batch is abandoned (None to wait)
 
-# Auto-apply integration when module is imported
-try:
-    enhance_existing_scraper_with_store_integration()
-except Exception as e:
-    logger.warning(f"Could not auto-apply store integration: {e}")
+    Returns:
+        list of products with updated store information
+    """
+    # Run on the shared background loop
+    return _run_sync(
+        retry_missing_store_info_async(
+            products,
+            proxy_provider=proxy_provider,
+            batch_size=batch_size,
+            delay=delay,
+            max_concurrent_batches=max_concurrent_batches,
+            batch_timeout=batch_timeout,
+        )
+    )
@@ -8,10 +8,23 @@ for environments where MCP Playwright is not available.
 """
 
 import asyncio
+import json
 import logging
-from typing import Any, cast
-
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+import os
+import re
+import signal
+import threading
+from typing import Any
+
+import requests
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    async_playwright,
+)
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from .scraper_interface import (
     StoreInfo,
@@ -22,6 +35,242 @@ from .scraper_interface import (
 
 logger = logging.getLogger(__name__)
 
+# URL patterns Chromium blocks in its network stack when bandwidth
+# optimization is on: images, fonts, media, sockets and third-party
+# analytics/ads (mmstat.com is AliExpress analytics)
+_BLOCKED_URL_PATTERNS = (
+    "*.png*",
+    "*.jpg*",
+    "*.jpeg*",
+    "*.gif*",
+    "*.webp*",
+    "*.avif*",
+    "*.svg*",
+    "*.ico*",
+    "*.woff*",
+    "*.ttf*",
+    "*.otf*",
+    "*.eot*",
+    "*.mp4*",
+    "*.webm*",
+    "*.mp3*",
+    "*.m3u8*",
+    "ws://*",
+    "wss://*",
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*doubleclick.net*",
+    "*facebook.com/tr*",
+    "*adsystem.amazon.com*",
+    "*googlesyndication.com*",
+    "*scorecardresearch.com*",
+    "*outbrain.com*",
+    "*taboola.com*",
+    "*mmstat.com*",
+)
+_STYLESHEET_URL_PATTERNS = ("*.css*",)
+
+_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36"
+
+# Store details embedded in the server-rendered product page, used to skip the
+# browser when the plain HTML already has them. Name and URL are read from the
+# same flat JSON object (the store module) so they always describe one store.
+_HTML_STORE_OBJECT_RE = re.compile(r'\{[^{}]*"storeName"\s*:[^{}]*\}')
+_HTML_STORE_NAME_RE = re.compile(r'"storeName"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_HTML_STORE_URL_RE = re.compile(r'"storeURL"\s*:\s*"([^"]*?/store/(\d+)[^"]*)"')
+
+# Element holding the store name on the current product page layout (the
+# primary lookup in _EXTRACT_STORE_JS); pages are ready once it is attached.
+# CSS form of //*[@id="root"]/div/div[1]/div/div[2]/div/div/a/div[2], which
+# Chromium matches far faster than it evaluates the XPath
+_STORE_NAME_SELECTOR = (
+    "#root > div > div:nth-of-type(1) > div > div:nth-of-type(2) > div > div > a"
+    " > div:nth-of-type(2)"
+)
+# Store elements that signal the page is ready to extract: the primary element
+# or the dedicated store-name elements of other layouts (the first CSS lookups)
+_STORE_READY_SELECTOR = ", ".join(
+    (_STORE_NAME_SELECTOR, '[data-pl="store-name"]', ".store-name", ".seller-name")
+)
+# Longest wait for one before extracting anyway; no longer than the fixed
+# sleep this replaced, so layouts matching none are never slower
+_STORE_WAIT_MS = 1500
+
+# Store lookup run in the page: primary selector, then CSS selectors, then store
+# links and breadcrumbs. Returns the first hit with a store name or ID, or null.
+# Installed once per context as an init script so pages only receive the call.
+_EXTRACT_STORE_JS = r"""
+() => {
+    const storeFromLink = (href) => {
+        const match = href ? href.match(/store\/([0-9]+)/) : null;
+        return match ? { store_id: match[1], store_url: href } : { store_id: null, store_url: null };
+    };
+    const hit = (method, detail, storeName, link) => {
+        const result = { store_name: storeName, ...storeFromLink(link), method: method, detail: detail };
+        return result.store_name || result.store_id ? result : null;
+    };
+
+    // Primary store name element (_STORE_NAME_SELECTOR, formerly an XPath)
+    const primaryElement = document.querySelector(
+        '#root > div > div:nth-of-type(1) > div > div:nth-of-type(2) > div > div > a > div:nth-of-type(2)'
+    );
+    if (primaryElement) {
+        const result = hit('xpath', null, primaryElement.textContent?.trim(), primaryElement.closest('a')?.href);
+        if (result) return result;
+    }
+
+    // CSS selectors
+    const selectors = [
+        '[data-pl="store-name"]',
+        '.store-name',
+        '.seller-name',
+        '[class*="store"]',
+        '[class*="seller"]'
+    ];
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        const text = element?.textContent?.trim();
+        if (text) {
+            const link = element.closest('a')?.href || document.querySelector('a[href*="/store/"]')?.href;
+            return hit('css', selector, text, link);
+        }
+    }
+
+    // Store links anywhere in the page
+    for (const link of document.querySelectorAll('a[href*="/store/"]')) {
+        const text = link.textContent?.trim();
+        if (text && storeFromLink(link.href).store_id) {
+            return hit('alternative', 'store_link', text, link.href);
+        }
+    }
+
+    // Seller information in breadcrumbs or headers
+    const breadcrumbSelectors = [
+        '.breadcrumb a',
+        '[class*="breadcrumb"] a',
+        'nav a',
+        '.seller-info',
+        '.store-info'
+    ];
+    for (const selector of breadcrumbSelectors) {
+        for (const element of document.querySelectorAll(selector)) {
+            const text = element.textContent?.trim();
+            if (text && (text.includes('Store') || text.includes('Shop'))) {
+                const href = element.href;
+                if (href && href.includes('/store/') && storeFromLink(href).store_id) {
+                    return hit('alternative', 'breadcrumb', text, href);
+                }
+            }
+        }
+    }
+
+    return null;
+}
+"""
+_EXTRACT_STORE_INIT_SCRIPT = f"window.__extractStore = {_EXTRACT_STORE_JS.strip()};"
+_EXTRACT_STORE_CALL = "() => window.__extractStore()"
+
+# Optimized browser arguments for store scraping
+_BROWSER_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-blink-features=AutomationControlled",
+    "--excludeSwitches=enable-automation",
+    "--disable-web-security",  # Help with CORS issues
+    "--disable-features=VizDisplayCompositor",
+)
+# Launch flags that stop images and web fonts from loading at all
+_BANDWIDTH_BROWSER_ARGS = (
+    "--blink-settings=imagesEnabled=false",
+    "--disable-remote-fonts",
+)
+# Launch flags that trim Chromium's memory use for long batch runs; all pages
+# share one renderer, which is fine when every page is on AliExpress
+_LOW_MEMORY_BROWSER_ARGS = (
+    "--renderer-process-limit=1",
+    "--disable-gpu",
+    "--disable-software-rasterizer",
+    "--disable-extensions",
+    "--disable-default-apps",
+    "--mute-audio",
+    "--no-first-run",
+)
+
+
+class _SharedBrowser:
+    """A Chromium process shared by scraper instances with the same settings"""
+
+    def __init__(self, playwright: Playwright, browser: Browser):
+        self.playwright = playwright
+        self.browser = browser
+        self.users = 0
+
+
+# Browsers in use, keyed by event loop and launch settings; each scraper still
+# gets its own context, so proxies and routes stay per instance
+_shared_browsers: dict[
+    tuple[asyncio.AbstractEventLoop, bool, bool, bool], _SharedBrowser
+] = {}
+
+
+async def _acquire_shared_browser(
+    headless: bool, optimize_bandwidth: bool, low_mem_mode: bool
+) -> Browser:
+    """Return a running browser for these settings, launching one if needed"""
+    loop = asyncio.get_running_loop()
+    # Browsers from finished loops can no longer be used or closed
+    for key in [key for key in _shared_browsers if key[0].is_closed()]:
+        del _shared_browsers[key]
+
+    key = (loop, headless, optimize_bandwidth, low_mem_mode)
+    shared = _shared_browsers.get(key)
+    if shared is None or not shared.browser.is_connected():
+        if shared is not None:
+            # Crashed browser; its users re-acquire when they notice
+            del _shared_browsers[key]
+            await shared.playwright.stop()
+
+        browser_args = list(_BROWSER_ARGS)
+        if optimize_bandwidth:
+            browser_args.extend(_BANDWIDTH_BROWSER_ARGS)
+        if low_mem_mode:
+            browser_args.extend(_LOW_MEMORY_BROWSER_ARGS)
+
+        playwright = await async_playwright().start()
+        try:
+            browser = await playwright.chromium.launch(
+                headless=headless, args=browser_args
+            )
+        except BaseException:
+            await playwright.stop()
+            raise
+
+        # Another scraper may have launched one while this one was starting
+        shared = _shared_browsers.get(key)
+        if shared is not None and shared.browser.is_connected():
+            await browser.close()
+            await playwright.stop()
+        else:
+            shared = _shared_browsers[key] = _SharedBrowser(playwright, browser)
+
+    shared.users += 1
+    return shared.browser
+
+
+async def _release_shared_browser(browser: Browser) -> None:
+    """Drop a scraper's hold on a shared browser, closing it after the last"""
+    for key, shared in _shared_browsers.items():
+        if shared.browser is browser:
+            shared.users -= 1
+            if shared.users <= 0:
+                del _shared_browsers[key]
+                await browser.close()
+                await shared.playwright.stop()
+            return
+
 
 @register_store_scraper(StoreScrapingMethod.TRADITIONAL_PLAYWRIGHT)
 class TraditionalPlaywrightStoreScraper(StoreScraperInterface):
@@ -42,6 +291,9 @@ class TraditionalPlaywrightStoreScraper(StoreScraperInterface):
         optimize_bandwidth: bool = True,
         track_bandwidth_savings: bool = False,
         enable_css: bool = False,
+        max_concurrent_pages: int | None = None,
+        try_http_first: bool = False,
+        low_mem_mode: bool = False,
         **kwargs: Any,
     ):
         """
@@ -56,6 +308,13 @@ class TraditionalPlaywrightStoreScraper(StoreScraperInterface):
             optimize_bandwidth: Whether to enable bandwidth optimization (block CSS, images, etc.)
             track_bandwidth_savings: Whether to track and log bandwidth savings statistics
             enable_css: Whether to allow CSS stylesheets to load (useful for visual inspection)
+            max_concurrent_pages: Pages scraping at once across all batches
+                (defaults to twice the CPU count, capped at 16)
+            try_http_first: Whether to read store info from the plain HTML before
+                opening a browser page (off by default: URLs whose HTML lacks the
+                store module are fetched twice)
+            low_mem_mode: Whether to launch Chromium with memory-saving flags
+                (single renderer process, no GPU) for large batches
             **kwargs: Additional configuration options
         """
         self.use_oxylabs_proxy = use_oxylabs_proxy
@@ -66,6 +325,11 @@ class TraditionalPlaywrightStoreScraper(StoreScraperInterface):
         self.optimize_bandwidth = optimize_bandwidth
         self.track_bandwidth_savings = track_bandwidth_savings
         self.enable_css = enable_css
+        self.max_concurrent_pages = max_concurrent_pages or min(
+            (os.cpu_count() or 1) * 2, 16
+        )
+        self.try_http_first = try_http_first
+        self.low_mem_mode = low_mem_mode
         self.config = kwargs
 
         # Manual wait configuration
@@ -73,9 +337,20 @@ class TraditionalPlaywrightStoreScraper(StoreScraperInterface):
         self.browser_wait_seconds = kwargs.get("browser_wait_seconds", 3)
 
         # Browser instances for reuse
-        self._playwright = None
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
+        # Browser lock and page semaphore per event loop: the registry shares
+        # this instance between the _run_sync loop and CLI worker threads, and
+        # asyncio primitives bind to the first loop that waits on them
+        self._loop_primitives: dict[
+            asyncio.AbstractEventLoop, tuple[asyncio.Lock, asyncio.Semaphore]
+        ] = {}
+        self._loop_primitives_lock = threading.Lock()
+        # Pages kept open between scrapes; navigated to about:blank when idle
+        self._idle_pages: list[Page] = []
+
+        # HTTP sessions for the HTML-first lookup, one per worker thread
+        self._http = threading.local()
 
         # Bandwidth tracking
         self._total_requests = 0
@@ -104,6 +379,9 @@ class TraditionalPlaywrightStoreScraper(StoreScraperInterface):
             "retry_attempts": self.retry_attempts,
             "optimize_bandwidth": self.optimize_bandwidth,
             "track_bandwidth_savings": self.track_bandwidth_savings,
+            "max_concurrent_pages": self.max_concurrent_pages,
+            "try_http_first": self.try_http_first,
+            "low_mem_mode": self.low_mem_mode,
             "config": self.config,
         }
 
@@ -124,125 +402,127 @@ class TraditionalPlaywrightStoreScraper(StoreScraperInterface):
 
         return scraper_info
 
+    def _primitives(self) -> tuple[asyncio.Lock, asyncio.Semaphore]:
+        """Browser lock and page semaphore for the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._loop_primitives_lock:
+            primitives = self._loop_primitives.get(loop)
+            if primitives is None:
+                # Primitives of finished loops can no longer be used
+                for key in [key for key in self._loop_primitives if key.is_closed()]:
+                    del self._loop_primitives[key]
+                primitives = self._loop_primitives[loop] = (
+                    asyncio.Lock(),
+                    # Shared by concurrent scrape_multiple_stores calls on this loop
+                    asyncio.Semaphore(self.max_concurrent_pages),
+                )
+            return primitives
+
     async def _initialize_browser(self) -> None:
         """Initialize browser and context"""
-        if self._browser and not self._browser.is_connected():
-            await self._cleanup_browser()
-
-        if not self._browser:
-            self._playwright = await async_playwright().start()
-
-            # Optimized browser arguments for store scraping with bandwidth optimization
-            browser_args = [
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-background-networking",
-                "--disable-background-timer-throttling",
-                "--disable-renderer-backgrounding",
-                "--disable-blink-features=AutomationControlled",
-                "--excludeSwitches=enable-automation",
-                "--disable-web-security",  # Help with CORS issues
-                "--disable-features=VizDisplayCompositor",
-            ]
-
-            self._browser = await self._playwright.chromium.launch(
-                headless=self.headless, args=browser_args
-            )
+        browser_lock, _ = self._primitives()
+        # Concurrent batches share this scraper; only one may launch the browser
+        async with browser_lock:
+            if self._browser and not self._browser.is_connected():
+                await self._cleanup_browser()
+
+            if not self._browser:
+                # The Chromium process is shared; the context is ours alone
+                self._browser = await _acquire_shared_browser(
+                    self.headless, self.optimize_bandwidth, self.low_mem_mode
+                )
 
-            # Configure context with proxy if needed
-            context_options: dict[str, Any] = {
-                "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-                "java_script_enabled": True,
-                "ignore_https_errors": True,
-            }
+                # Configure context with proxy if needed
+                context_options: dict[str, Any] = {
+                    "user_agent": _USER_AGENT,
+                    "java_script_enabled": True,
+                    "ignore_https_errors": True,
+                }
 
-            if self.use_oxylabs_proxy:
-                # Configure Oxylabs proxy
-                import os
+                if self.use_oxylabs_proxy:
+                    # Configure Oxylabs proxy
+                    import os
 
-                username = os.getenv("OXYLABS_USERNAME")
-                password = os.getenv("OXYLABS_PASSWORD")
-                endpoint = os.getenv("OXYLABS_ENDPOINT", "pr.oxylabs.io:7777")
+                    username = os.getenv("OXYLABS_USERNAME")
+                    password = os.getenv("OXYLABS_PASSWORD")
+                    endpoint = os.getenv("OXYLABS_ENDPOINT", "pr.oxylabs.io:7777")
 
-                if username and password:
-                    context_options["proxy"] = {
-                        "server": f"http://{endpoint}",
-                        "username": username,
-                        "password": password,
-                    }
-                    logger.info(f"🌐 Configured Oxylabs proxy: {endpoint}")
-                else:
-                    logger.warning("⚠️ Oxylabs credentials not found in environment")
+                    if username and password:
+                        context_options["proxy"] = {
+                            "server": f"http://{endpoint}",
+                            "username": username,
+                            "password": password,
+                        }
+                        logger.info(f"🌐 Configured Oxylabs proxy: {endpoint}")
+                    else:
+                        logger.warning("⚠️ Oxylabs credentials not found in environment")
+
+                self._context = await self._browser.new_context(**context_options)
+                await self._context.add_init_script(script=_EXTRACT_STORE_INIT_SCRIPT)
 
-            self._context = await self._browser.new_context(**context_options)
+    async def _new_page(self) -> Page:
+        """Open a page, blocking unneeded resources inside Chromium if enabled"""
+        if not self._context:
+            raise RuntimeError("Browser context not initialized")
 
-            # Enhanced bandwidth optimization - block unnecessary resources (if enabled)
-            if self.optimize_bandwidth:
-                await self._context.route("**/*", self._handle_route)
+        page = await self._context.new_page()
+        if self.optimize_bandwidth:
+            await self._block_resources(page)
+        return page
+
+    async def _acquire_page(self) -> Page:
+        """Reuse an idle page from an earlier scrape, opening one if none is free"""
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+            if not page.is_closed():
+                return page
+        return await self._new_page()
+
+    async def _release_page(self, page: Page) -> None:
+        """Blank the page and keep it for the next scrape"""
+        if page.is_closed():
+            return
+        try:
+            await page.goto("about:blank")
+        except Exception:
+            # A page that cannot be reset is not worth reusing
+            await page.close()
+            return
+        self._idle_pages.append(page)
 
-    async def _handle_route(self, route: Any, request: Any) -> None:
+    async def _block_resources(self, page: Page) -> None:
         """
-        Enhanced route handler for bandwidth optimization
-
-        Blocks multiple resource types to reduce bandwidth usage:
-        - CSS stylesheets (for faster loading, content still accessible)
-        - Images (significant bandwidth savings)
-        - Fonts (non-essential for data extraction)
-        - Media files (audio/video)
-        - WebSocket connections (not needed for scraping)
+        Bandwidth optimization via CDP Network.setBlockedURLs
+
+        Blocked requests fail in Chromium's network stack, so no request is
+        routed through Python:
+        - CSS stylesheets (unless enable_css is set)
+        - Images, fonts and media files
+        - WebSocket connections
         - Third-party analytics and ads
         """
-        # Track total requests if bandwidth tracking is enabled
+        patterns = list(_BLOCKED_URL_PATTERNS)
+        if not self.enable_css:
+            patterns.extend(_STYLESHEET_URL_PATTERNS)
+
+        session = await page.context.new_cdp_session(page)
+
+        # Counting needs per-request events, so listen only when tracking
         if self.track_bandwidth_savings:
-            self._total_requests += 1
+            session.on("Network.requestWillBeSent", self._count_request)
+            session.on("Network.loadingFailed", self._count_blocked)
 
-        # Skip blocking if bandwidth optimization is disabled
-        if not self.optimize_bandwidth:
-            await route.continue_()
-            return
+        await session.send("Network.enable")
+        await session.send("Network.setBlockedURLs", {"urls": patterns})
 
-        # Resource types to block for bandwidth optimization (your approach)
-        blocked_types = {"image", "font", "media", "websocket"}
+    def _count_request(self, event: dict[str, Any]) -> None:
+        """Count a request for bandwidth tracking"""
+        self._total_requests += 1
 
-        # Conditionally add stylesheet blocking (exclude if CSS is enabled)
-        if not self.enable_css:
-            blocked_types.add("stylesheet")
-
-        # Additional patterns for analytics/ads (common third-party domains)
-        blocked_patterns = [
-            "googletagmanager.com",
-            "google-analytics.com",
-            "doubleclick.net",
-            "facebook.com/tr",
-            "adsystem.amazon.com",
-            "googlesyndication.com",
-            "scorecardresearch.com",
-            "outbrain.com",
-            "taboola.com",
-            "mmstat.com",  # AliExpress analytics
-        ]
-
-        should_block = False
-
-        # Check resource type (your approach - this is the core of your bandwidth optimization)
-        if request.resource_type in blocked_types:
-            should_block = True
-
-        # Check URL patterns for analytics/ads
-        elif any(pattern in request.url for pattern in blocked_patterns):
-            should_block = True
-
-        if should_block:
-            if self.track_bandwidth_savings:
-                self._blocked_requests += 1
-            await route.abort()
-            # Optional: log blocked resources in debug mode
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(
-                    f"🚫 BLOCKED [{request.resource_type}]: {request.url[:100]}..."
-                )
-        else:
-            await route.continue_()
+    def _count_blocked(self, event: dict[str, Any]) -> None:
+        """Count a request Chromium blocked for bandwidth tracking"""
+        if event.get("blockedReason"):
+            self._blocked_requests += 1
 
     def reset_bandwidth_tracking(self) -> None:
         """Reset bandwidth tracking counters"""
@@ -277,15 +557,14 @@ class TraditionalPlaywrightStoreScraper(StoreScraperInterface):
                 f"requests blocked ({stats['bandwidth_saved_percent']}%)"
             )
 
+        # Closing the context closes the idle pages with it
+        self._idle_pages.clear()
         if self._context:
             await self._context.close()
             self._context = None
         if self._browser:
-            await self._browser.close()
-            self._browser = None
-        if self._playwright:
-            await self._playwright.stop()
-            self._playwright = None
+            browser, self._browser = self._browser, None
+            await _release_shared_browser(browser)
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -302,13 +581,16 @@ class TraditionalPlaywrightStoreScraper(StoreScraperInterface):
         """
         logger.info(f"🔍 Scraping store info from: {product_url}")
 
+        # Manual inspection needs the page, so only skip the browser otherwise
+        if self.try_http_first and not self.manual_wait:
+            store_info = await self._try_http_extract(product_url)
+            if store_info:
+                logger.info(f"✅ Successfully extracted store: {store_info.store_name}")
+                return store_info
+
         try:
             await self._initialize_browser()
-
-            if not self._context:
-                raise RuntimeError("Browser context not initialized")
-
-            page = await self._context.new_page()
+            page = await self._acquire_page()
 
             try:
                 # Navigate to the product page
@@ -320,7 +602,7 @@ class TraditionalPlaywrightStoreScraper(StoreScraperInterface):
                 )
 
                 # Wait for page to be ready
-                await page.wait_for_timeout(2000)
+                await self._wait_for_store(page)
 
                 # Extract store information using multiple methods
                 store_info = await self._extract_store_info_with_fallback(
@@ -366,10 +648,7 @@ class TraditionalPlaywrightStoreScraper(StoreScraperInterface):
                         print(f"      - Check for store information")
                         print(f"   ⏸️  Press Ctrl+C when ready to close browser...")
                     try:
-                        # Use an infinite sleep that can be interrupted by Ctrl+C
-                        while True:
-                            await asyncio.sleep(1)
-                    except KeyboardInterrupt:
+                        await self._wait_for_interrupt()
                         print(f"   ✅ Manual wait completed - closing browser...")
                     except Exception as e:
                         print(f"   ⚠️  Manual wait interrupted: {e}")
@@ -377,7 +656,7 @@ class TraditionalPlaywrightStoreScraper(StoreScraperInterface):
                 return store_info
 
             finally:
-                await page.close()
+                await self._release_page(page)
 
         except Exception as e:
             error_msg = f"Error scraping store info from {product_url}: {str(e)}"
@@ -388,6 +667,35 @@ class TraditionalPlaywrightStoreScraper(StoreScraperInterface):
                 extraction_method="traditional_playwright_error",
             )
 
+    async def _wait_for_interrupt(self) -> None:
+        """Block until Ctrl+C without waking the event loop in the meantime"""
+        loop = asyncio.get_running_loop()
+        interrupted = loop.create_future()
+        previous_handler = signal.getsignal(signal.SIGINT)
+        try:
+            loop.add_signal_handler(signal.SIGINT, interrupted.cancel)
+            installed = True
+        except (NotImplementedError, RuntimeError, ValueError):
+            # No loop signal handlers here (Windows or a worker thread); Ctrl+C
+            # then arrives as KeyboardInterrupt instead
+            installed = False
+
+        try:
+            await interrupted
+        except KeyboardInterrupt:
+            pass
+        except asyncio.CancelledError:
+            # Cancelled from outside rather than by Ctrl+C
+            current = asyncio.current_task()
+            if current and current.cancelling():
+                raise
+        finally:
+            if installed:
+                loop.remove_signal_handler(signal.SIGINT)
+                # Put back asyncio.run's own Ctrl+C handling
+                if previous_handler is not None:
+                    signal.signal(signal.SIGINT, previous_handler)
+
     async def scrape_multiple_stores(
         self, product_urls: list[str], **kwargs: Any
     ) -> dict[str, StoreInfo]:
@@ -409,47 +717,26 @@ class TraditionalPlaywrightStoreScraper(StoreScraperInterface):
             if not self._context:
                 raise RuntimeError("Browser context not initialized")
 
-            # Process URLs with controlled concurrency
-            batch_size = kwargs.get("batch_size", 3)  # Lower for traditional Playwright
-            delay_between_batches = kwargs.get("delay_between_batches", 3.0)
-
-            for i in range(0, len(product_urls), batch_size):
-                batch = product_urls[i : i + batch_size]
-                batch_num = (i // batch_size) + 1
-                total_batches = (len(product_urls) + batch_size - 1) // batch_size
-
-                logger.info(
-                    f"📦 Processing batch {batch_num}/{total_batches} ({len(batch)} URLs)"
-                )
-
-                # Process batch concurrently
-                batch_tasks = [
-                    self._scrape_single_with_page(url, **kwargs) for url in batch
-                ]
-
-                batch_results = await asyncio.gather(
-                    *batch_tasks, return_exceptions=True
-                )
+            # Every URL is queued at once; the semaphore bounds open pages and
+            # a page starts on the next URL as soon as it is free
+            _, page_semaphore = self._primitives()
 
-                # Collect results
-                for url, result in zip(batch, batch_results):
-                    if isinstance(result, Exception):
-                        logger.error(f"❌ Error processing {url}: {result}")
-                        results[url] = StoreInfo(
+            async def scrape_bounded(url: str) -> StoreInfo:
+                async with page_semaphore:
+                    try:
+                        return await self._scrape_single_with_page(url, **kwargs)
+                    except Exception as e:
+                        logger.error(f"❌ Error processing {url}: {e}")
+                        return StoreInfo(
                             source_url=url,
-                            error=str(result),
+                            error=str(e),
                             extraction_method="traditional_playwright_batch_error",
                         )
-                    else:
-                        # Type assertion: result is StoreInfo here after isinstance check
-                        results[url] = cast(StoreInfo, result)
 
-                # Delay between batches
-                if i + batch_size < len(product_urls):
-                    logger.debug(
-                        f"⏳ Waiting {delay_between_batches}s before next batch..."
-                    )
-                    await asyncio.sleep(delay_between_batches)
+            url_results = await asyncio.gather(
+                *(scrape_bounded(url) for url in product_urls)
+            )
+            results.update(zip(product_urls, url_results))
 
         finally:
             # Keep browser alive for potential reuse
@@ -473,279 +760,138 @@ class TraditionalPlaywrightStoreScraper(StoreScraperInterface):
     async def _scrape_single_with_page(
         self, product_url: str, **kwargs: Any
     ) -> StoreInfo:
-        """Scrape single URL with its own page instance"""
-        if not self._context:
-            raise RuntimeError("Browser context not initialized")
+        """Scrape single URL on a page of its own, reused afterwards"""
+        if self.try_http_first:
+            store_info = await self._try_http_extract(product_url)
+            if store_info:
+                return store_info
 
-        page = await self._context.new_page()
+        page = await self._acquire_page()
         try:
             await page.goto(
                 product_url,
                 timeout=self.navigation_timeout * 1000,
                 wait_until="domcontentloaded",
             )
-            await page.wait_for_timeout(1500)
+            await self._wait_for_store(page)
             return await self._extract_store_info_with_fallback(page, product_url)
         finally:
-            await page.close()
+            await self._release_page(page)
+
+    def _http_session(self) -> requests.Session:
+        """Session for the calling thread, created on first use"""
+        session: requests.Session | None = getattr(self._http, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers["User-Agent"] = _USER_AGENT
+            if self.use_oxylabs_proxy:
+                username = os.getenv("OXYLABS_USERNAME")
+                password = os.getenv("OXYLABS_PASSWORD")
+                endpoint = os.getenv("OXYLABS_ENDPOINT", "pr.oxylabs.io:7777")
+                if username and password:
+                    proxy_url = f"http://{username}:{password}@{endpoint}"
+                    session.proxies = {"http": proxy_url, "https": proxy_url}
+            self._http.session = session
+        return session
+
+    def _fetch_html(self, product_url: str) -> str | None:
+        """Product page HTML, or None if it was blocked or redirected away"""
+        response = self._http_session().get(
+            product_url, timeout=self.extraction_timeout
+        )
+        # Captcha challenges redirect to a punish page instead of the product
+        if response.status_code != 200 or "punish" in response.url:
+            return None
+        return response.text
 
-    async def _extract_store_info_with_fallback(
-        self, page: Page, product_url: str
-    ) -> StoreInfo:
-        """
-        Extract store information using multiple fallback methods
-        """
-        # Primary XPath method
-        store_info = await self._extract_store_name_with_xpath(page, product_url)
-        if store_info.is_valid:
-            return store_info
-
-        # Fallback to CSS selector method
-        store_info = await self._extract_store_name_with_css(page, product_url)
-        if store_info.is_valid:
-            return store_info
-
-        # Fallback to alternative XPath
-        store_info = await self._extract_store_name_alternative(page, product_url)
-        if store_info.is_valid:
-            return store_info
-
-        # All methods failed
+    async def _try_http_extract(self, product_url: str) -> StoreInfo | None:
+        """Read store info from the server-rendered HTML, or None to use the browser"""
+        try:
+            page_html = await asyncio.to_thread(self._fetch_html, product_url)
+        except requests.RequestException as e:
+            logger.debug(f"HTML store lookup failed for {product_url}: {e}")
+            return None
+        if not page_html:
+            return None
+
+        # Only a store object with both a name and an ID is trusted; anything
+        # less is left to the browser lookup
+        for object_match in _HTML_STORE_OBJECT_RE.finditer(page_html):
+            store_module = object_match.group(0)
+            name_match = _HTML_STORE_NAME_RE.search(store_module)
+            url_match = _HTML_STORE_URL_RE.search(store_module)
+            if not (name_match and url_match):
+                continue
+            try:
+                store_name = json.loads(f'"{name_match.group(1)}"').strip()
+            except ValueError:
+                continue
+            if store_name:
+                store_url, store_id = url_match.groups()
+                break
+        else:
+            return None
+        if store_url.startswith("//"):
+            store_url = f"https:{store_url}"
+
+        logger.debug("✅ Store info extracted from page HTML")
         return StoreInfo(
+            store_name=store_name,
+            store_id=store_id,
+            store_url=store_url,
             source_url=product_url,
-            error="All extraction methods failed to find store information",
-            extraction_method="traditional_playwright_all_failed",
+            extraction_method="traditional_playwright_http",
         )
 
-    async def _extract_store_name_with_xpath(
-        self, page: Page, product_url: str
-    ) -> StoreInfo:
-        """Extract store name using the primary XPath selector"""
+    async def _wait_for_store(self, page: Page) -> None:
+        """Wait until a store name element renders, up to _STORE_WAIT_MS"""
         try:
-            xpath_selector = '//*[@id="root"]/div/div[1]/div/div[2]/div/div/a/div[2]'
-
-            result = await page.evaluate(f"""
-                () => {{
-                    const element = document.evaluate(
-                        '{xpath_selector}',
-                        document,
-                        null,
-                        XPathResult.FIRST_ORDERED_NODE_TYPE,
-                        null
-                    ).singleNodeValue;
-                    
-                    if (element) {{
-                        const storeNameText = element.textContent?.trim();
-                        
-                        // Try to extract store ID from URL
-                        const storeLink = element.closest('a')?.href;
-                        let storeId = null;
-                        let storeUrl = null;
-                        
-                        if (storeLink) {{
-                            const storeIdMatch = storeLink.match(/store\\/([0-9]+)/);
-                            if (storeIdMatch) {{
-                                storeId = storeIdMatch[1];
-                                storeUrl = storeLink;
-                            }}
-                        }}
-                        
-                        return {{
-                            store_name: storeNameText,
-                            store_id: storeId,
-                            store_url: storeUrl,
-                            found: true
-                        }};
-                    }}
-                    
-                    return {{ found: false }};
-                }}
-            """)
-
-            if result and result.get("found"):
-                logger.debug("✅ Store info extracted using XPath method")
-                return StoreInfo(
-                    store_name=result.get("store_name"),
-                    store_id=result.get("store_id"),
-                    store_url=result.get("store_url"),
-                    source_url=product_url,
-                    extraction_method="traditional_playwright_xpath",
-                )
-            else:
-                return StoreInfo(
-                    source_url=product_url,
-                    error="XPath selector did not find store element",
-                    extraction_method="traditional_playwright_xpath_failed",
-                )
-
-        except Exception as e:
-            return StoreInfo(
-                source_url=product_url,
-                error=f"XPath extraction error: {str(e)}",
-                extraction_method="traditional_playwright_xpath_error",
+            await page.wait_for_selector(
+                _STORE_READY_SELECTOR, timeout=_STORE_WAIT_MS, state="attached"
             )
+        except PlaywrightTimeoutError:
+            # Extraction falls back to the other lookups on different layouts
+            pass
 
-    async def _extract_store_name_with_css(
+    async def _extract_store_info_with_fallback(
         self, page: Page, product_url: str
     ) -> StoreInfo:
-        """Extract store name using CSS selectors as fallback"""
-        try:
-            result = await page.evaluate("""
-                () => {
-                    // Try various CSS selectors for store information
-                    const selectors = [
-                        '[data-pl="store-name"]',
-                        '.store-name',
-                        '.seller-name',
-                        '[class*="store"]',
-                        '[class*="seller"]'
-                    ];
-                    
-                    for (const selector of selectors) {
-                        const element = document.querySelector(selector);
-                        if (element) {
-                            const storeNameText = element.textContent?.trim();
-                            if (storeNameText) {
-                                // Try to find store link
-                                const storeLink = element.closest('a')?.href || 
-                                                document.querySelector('a[href*="/store/"]')?.href;
-                                
-                                let storeId = null;
-                                let storeUrl = null;
-                                
-                                if (storeLink) {
-                                    const storeIdMatch = storeLink.match(/store\\/([0-9]+)/);
-                                    if (storeIdMatch) {
-                                        storeId = storeIdMatch[1];
-                                        storeUrl = storeLink;
-                                    }
-                                }
-                                
-                                return {
-                                    store_name: storeNameText,
-                                    store_id: storeId,
-                                    store_url: storeUrl,
-                                    found: true,
-                                    selector: selector
-                                };
-                            }
-                        }
-                    }
-                    
-                    return { found: false };
-                }
-            """)
-
-            if result and result.get("found"):
-                logger.debug(
-                    f"✅ Store info extracted using CSS selector: {result.get('selector')}"
-                )
-                return StoreInfo(
-                    store_name=result.get("store_name"),
-                    store_id=result.get("store_id"),
-                    store_url=result.get("store_url"),
-                    source_url=product_url,
-                    extraction_method="traditional_playwright_css",
-                    metadata={"css_selector": result.get("selector")},
-                )
-            else:
-                return StoreInfo(
-                    source_url=product_url,
-                    error="CSS selectors did not find store element",
-                    extraction_method="traditional_playwright_css_failed",
-                )
+        """
+        Extract store information using multiple fallback methods
 
+        Primary element, CSS selector and alternative lookups all run in one
+        evaluate call; the first that finds a store name or ID wins.
+        """
+        try:
+            result = await page.evaluate(_EXTRACT_STORE_CALL)
         except Exception as e:
             return StoreInfo(
                 source_url=product_url,
-                error=f"CSS extraction error: {str(e)}",
-                extraction_method="traditional_playwright_css_error",
+                error=f"Store extraction error: {str(e)}",
+                extraction_method="traditional_playwright_error",
             )
 
-    async def _extract_store_name_alternative(
-        self, page: Page, product_url: str
-    ) -> StoreInfo:
-        """Extract store name using alternative methods"""
-        try:
-            result = await page.evaluate("""
-                () => {
-                    // Try to find store information in various ways
-                    
-                    // Method 1: Look for store links in the page
-                    const storeLinks = document.querySelectorAll('a[href*="/store/"]');
-                    for (const link of storeLinks) {
-                        const text = link.textContent?.trim();
-                        if (text && text.length > 0) {
-                            const storeIdMatch = link.href.match(/store\\/([0-9]+)/);
-                            if (storeIdMatch) {
-                                return {
-                                    store_name: text,
-                                    store_id: storeIdMatch[1],
-                                    store_url: link.href,
-                                    found: true,
-                                    method: 'store_link'
-                                };
-                            }
-                        }
-                    }
-                    
-                    // Method 2: Look for seller information in breadcrumbs or headers
-                    const breadcrumbSelectors = [
-                        '.breadcrumb a',
-                        '[class*="breadcrumb"] a',
-                        'nav a',
-                        '.seller-info',
-                        '.store-info'
-                    ];
-                    
-                    for (const selector of breadcrumbSelectors) {
-                        const elements = document.querySelectorAll(selector);
-                        for (const element of elements) {
-                            const text = element.textContent?.trim();
-                            if (text && (text.includes('Store') || text.includes('Shop'))) {
-                                const href = element.href;
-                                if (href && href.includes('/store/')) {
-                                    const storeIdMatch = href.match(/store\\/([0-9]+)/);
-                                    if (storeIdMatch) {
-                                        return {
-                                            store_name: text,
-                                            store_id: storeIdMatch[1],
-                                            store_url: href,
-                                            found: true,
-                                            method: 'breadcrumb'
-                                        };
-                                    }
-                                }
-                            }
-                        }
-                    }
-                    
-                    return { found: false };
-                }
-            """)
-
-            if result and result.get("found"):
-                logger.debug(
-                    f"✅ Store info extracted using alternative method: {result.get('method')}"
-                )
-                return StoreInfo(
-                    store_name=result.get("store_name"),
-                    store_id=result.get("store_id"),
-                    store_url=result.get("store_url"),
-                    source_url=product_url,
-                    extraction_method="traditional_playwright_alternative",
-                    metadata={"method": result.get("method")},
-                )
-            else:
-                return StoreInfo(
-                    source_url=product_url,
-                    error="Alternative methods did not find store element",
-                    extraction_method="traditional_playwright_alternative_failed",
-                )
-
-        except Exception as e:
+        if not result:
+            # All methods failed
             return StoreInfo(
                 source_url=product_url,
-                error=f"Alternative extraction error: {str(e)}",
-                extraction_method="traditional_playwright_alternative_error",
+                error="All extraction methods failed to find store information",
+                extraction_method="traditional_playwright_all_failed",
             )
+
+        method = result["method"]
+        metadata: dict[str, Any] = {}
+        if method == "css":
+            metadata["css_selector"] = result.get("detail")
+        elif method == "alternative":
+            metadata["method"] = result.get("detail")
+
+        logger.debug(f"✅ Store info extracted using {method} method")
+        return StoreInfo(
+            store_name=result.get("store_name"),
+            store_id=result.get("store_id"),
+            store_url=result.get("store_url"),
+            source_url=product_url,
+            extraction_method=f"traditional_playwright_{method}",
+            metadata=metadata,
+        )
@@ -0,0 +1,49 @@
+"""
+Fast JSON Helpers for AliExpress Scraper
+========================================
+
+Thin wrappers around orjson with a standard-library fallback. Everything
+works on bytes, so callers open files in binary mode and skip the extra
+UTF-8 encode/decode pass.
+
+Usage:
+    from aliexpress_scraper.utils.json_io import WRITE_BUFFER_SIZE, dumps, loads
+
+    with open(path, "rb") as f:
+        data = loads(f.read())
+    with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(dumps(data, indent=True))
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None
+
+# Buffer size for result writers; large enough to batch many rows per syscall
+WRITE_BUFFER_SIZE = 1 << 20
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one type covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (2-space indent when requested)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode(
+        "utf-8"
+    )
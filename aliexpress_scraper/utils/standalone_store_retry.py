@@ -14,8 +14,9 @@ import asyncio
 import json
 import sys
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Coroutine
 
 from .logger import ScraperLogger
 
@@ -31,6 +32,18 @@ except ImportError:
     pass  # traditional_store_scraper not available
 
 
+def _run_coro_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion from synchronous code"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Called from inside a running loop, which cannot be blocked on; run the
+    # coroutine on its own loop in a worker thread instead
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
 def load_products_from_json(
     json_file: str, logger: ScraperLogger | None = None
 ) -> list[dict[str, Any]]:
@@ -221,27 +234,7 @@ def test_full_store_scraping_process(
                         pass  # Ignore cleanup errors
 
         # Run the async function properly
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Nested event loop - run in thread
-                with ThreadPoolExecutor() as executor:
-
-                    def run_in_thread():
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        try:
-                            return new_loop.run_until_complete(test_with_real_scraper())
-                        finally:
-                            new_loop.close()
-
-                    future = executor.submit(run_in_thread)
-                    return future.result()
-            else:
-                return loop.run_until_complete(test_with_real_scraper())
-        except RuntimeError:
-            # No event loop
-            return asyncio.run(test_with_real_scraper())
+        return _run_coro_sync(test_with_real_scraper())
 
     except Exception as e:
         error_msg = f"Test failed with error: {str(e)}"
@@ -312,25 +305,7 @@ def test_single_url_debug(url: str, proxy_provider: str = "") -> dict[str, Any]:
             return {"success": False, "error": "All scraper methods failed"}
 
         # Run async debug
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                with ThreadPoolExecutor() as executor:
-
-                    def run_in_thread():
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        try:
-                            return new_loop.run_until_complete(debug_single_url())
-                        finally:
-                            new_loop.close()
-
-                    future = executor.submit(run_in_thread)
-                    return future.result()
-            else:
-                return loop.run_until_complete(debug_single_url())
-        except RuntimeError:
-            return asyncio.run(debug_single_url())
+        return _run_coro_sync(debug_single_url())
 
     except Exception as e:
         error_msg = f"Debug test failed: {str(e)}"
@@ -635,6 +610,151 @@ def compare_before_after(
     )
 
 
+@dataclass(slots=True)
+class StoreRetryConfig:
+    """Typed options for a standalone store retry run (mirrors the CLI flags)."""
+
+    input_file: str
+    output_file: str | None = None
+    proxy_provider: str = ""
+    batch_size: int = 5
+    delay: float = 2.0
+    max_retries: int = 3
+    dry_run: bool = False
+    debug: bool = False
+    headed: bool = False
+    manual_wait: bool = False
+    disable_css: bool = False
+    interactive: bool = False
+
+
+def run(config: StoreRetryConfig) -> None:
+    """Retry missing store info according to an already-built config."""
+    logger = ScraperLogger("Utils.StoreRetry")
+
+    # Input validation
+    input_path = Path(config.input_file)
+    if not input_path.exists():
+        logger.error("Input file not found", config.input_file)
+        sys.exit(1)
+
+    # Determine output file
+    if config.output_file:
+        output_file = config.output_file
+    else:
+        stem = input_path.stem
+        suffix = input_path.suffix
+        output_file = f"{stem}_with_stores{suffix}"
+
+    logger.start("Standalone Store Retry Script")
+    logger.config("Input", config.input_file)
+    logger.config("Output", output_file)
+
+    # Load products
+    products = load_products_from_json(config.input_file, logger)
+
+    # Analyze current state
+    stats = analyze_missing_store_info(products)
+    print_analysis(stats, logger)
+
+    # Dry run mode
+    if config.dry_run:
+        logger.info("Dry run mode - no changes will be made")
+        return
+
+    # Debug mode
+    if config.debug:
+        logger.info("Debug mode enabled")
+
+        # Get a sample URL for testing
+        sample_url = None
+        for product in products:
+            url = product.get("Product URL")
+            if url:
+                sample_url = url
+                break
+
+        if not sample_url:
+            logger.error("No product URLs found for debugging")
+            sys.exit(1)
+
+        print(f"   Sample URL: {sample_url}")
+
+        # Run debug test first
+        if config.headed:
+            # Try headed/visual mode first
+            print("🖥️ Try headed/visual mode? (y/n):", end=" ")
+            try:
+                choice = input().strip().lower()
+                if choice == "y":
+                    result = test_full_store_scraping_process(
+                        url=sample_url,
+                        proxy_provider=config.proxy_provider,
+                        headless=False,
+                        verbose=True,
+                        browser_wait_seconds=5,
+                        manual_wait=config.manual_wait,
+                        enable_css=not config.disable_css,  # CSS enabled by default
+                    )
+                else:
+                    # Fall back to headless debug
+                    result = test_single_url_debug(sample_url, config.proxy_provider)
+            except KeyboardInterrupt:
+                print("\n🛑 Debug cancelled by user")
+                sys.exit(0)
+        else:
+            # Regular debug test
+            result = test_single_url_debug(sample_url, config.proxy_provider)
+
+        print(f"\n🧪 Debug result: {result}")
+
+        if not result.get("success"):
+            print(
+                "❌ Debug test failed - you may want to check your setup before processing all products"
+            )
+            choice = input("Continue anyway? (y/n): ").strip().lower()
+            if choice != "y":
+                print("🛑 Exiting due to debug failure")
+                sys.exit(1)
+        else:
+            print("✅ Debug test passed - proceeding with full retry")
+
+    # Interactive mode
+    if config.interactive:
+        updated_products = retry_with_headed_mode(
+            products, proxy_provider=config.proxy_provider, failed_only=True
+        )
+    else:
+        # Regular retry mode
+        print(f"\n🚀 Starting retry process...")
+
+        try:
+            updated_products = asyncio.run(
+                retry_store_information(
+                    products=products,
+                    proxy_provider=config.proxy_provider,
+                    batch_size=config.batch_size,
+                    delay_seconds=config.delay,
+                    max_retries=config.max_retries,
+                )
+            )
+        except KeyboardInterrupt:
+            print("\n🛑 Process interrupted by user")
+            sys.exit(0)
+        except Exception as e:
+            print(f"❌ Retry process failed: {e}")
+            sys.exit(1)
+
+    # Compare results
+    compare_before_after(products, updated_products)
+
+    # Save results
+    save_products_to_json(updated_products, output_file)
+
+    print(f"\n✅ Process completed successfully!")
+    print(f"   Results saved to: {output_file}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Standalone Store Retry Script for AliExpress product data",
@@ -743,129 +863,23 @@ Examples:
     )
 
     args = parser.parse_args()
-    logger = ScraperLogger("Utils.StoreRetry")
-
-    # Input validation
-    input_path = Path(args.input_file)
-    if not input_path.exists():
-        logger.error("Input file not found", args.input_file)
-        sys.exit(1)
-
-    # Determine output file
-    if args.output_file:
-        output_file = args.output_file
-    else:
-        stem = input_path.stem
-        suffix = input_path.suffix
-        output_file = f"{stem}_with_stores{suffix}"
-
-    logger.start("Standalone Store Retry Script")
-    logger.config("Input", args.input_file)
-    logger.config("Output", output_file)
-
-    # Load products
-    products = load_products_from_json(args.input_file, logger)
-
-    # Analyze current state
-    stats = analyze_missing_store_info(products)
-    print_analysis(stats, logger)
-
-    # Dry run mode
-    if args.dry_run:
-        logger.info("Dry run mode - no changes will be made")
-        return
-
-    # Debug mode
-    if args.debug:
-        logger.info("Debug mode enabled")
-
-        # Get a sample URL for testing
-        sample_url = None
-        for product in products:
-            url = product.get("Product URL")
-            if url:
-                sample_url = url
-                break
-
-        if not sample_url:
-            logger.error("No product URLs found for debugging")
-            sys.exit(1)
-
-        print(f"   Sample URL: {sample_url}")
-
-        # Run debug test first
-        if args.headed:
-            # Try headed/visual mode first
-            print("🖥️ Try headed/visual mode? (y/n):", end=" ")
-            try:
-                choice = input().strip().lower()
-                if choice == "y":
-                    result = test_full_store_scraping_process(
-                        url=sample_url,
-                        proxy_provider=args.proxy_provider,
-                        headless=False,
-                        verbose=True,
-                        browser_wait_seconds=5,
-                        manual_wait=args.manual_wait,
-                        enable_css=not args.disable_css,  # CSS enabled by default
-                    )
-                else:
-                    # Fall back to headless debug
-                    result = test_single_url_debug(sample_url, args.proxy_provider)
-            except KeyboardInterrupt:
-                print("\n🛑 Debug cancelled by user")
-                sys.exit(0)
-        else:
-            # Regular debug test
-            result = test_single_url_debug(sample_url, args.proxy_provider)
 
-        print(f"\n🧪 Debug result: {result}")
-
-        if not result.get("success"):
-            print(
-                "❌ Debug test failed - you may want to check your setup before processing all products"
-            )
-            choice = input("Continue anyway? (y/n): ").strip().lower()
-            if choice != "y":
-                print("🛑 Exiting due to debug failure")
-                sys.exit(1)
-        else:
-            print("✅ Debug test passed - proceeding with full retry")
-
-    # Interactive mode
-    if args.interactive:
-        updated_products = retry_with_headed_mode(
-            products, proxy_provider=args.proxy_provider, failed_only=True
+    run(
+        StoreRetryConfig(
+            input_file=args.input_file,
+            output_file=args.output_file,
+            proxy_provider=args.proxy_provider,
+            batch_size=args.batch_size,
+            delay=args.delay,
+            max_retries=args.max_retries,
+            dry_run=args.dry_run,
+            debug=args.debug,
+            headed=args.headed,
+            manual_wait=args.manual_wait,
+            disable_css=args.disable_css,
+            interactive=args.interactive,
         )
-    else:
-        # Regular retry mode
-        print(f"\n🚀 Starting retry process...")
-
-        try:
-            updated_products = asyncio.run(
-                retry_store_information(
-                    products=products,
-                    proxy_provider=args.proxy_provider,
-                    batch_size=args.batch_size,
-                    delay_seconds=args.delay,
-                    max_retries=args.max_retries,
-                )
-            )
-        except KeyboardInterrupt:
-            print("\n🛑 Process interrupted by user")
-            sys.exit(0)
-        except Exception as e:
-            print(f"❌ Retry process failed: {e}")
-            sys.exit(1)
-
-    # Compare results
-    compare_before_after(products, updated_products)
-
-    # Save results
-    save_products_to_json(updated_products, output_file)
-
-    print(f"\n✅ Process completed successfully!")
-    print(f"   Results saved to: {output_file}")
+    )
 
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ import argparse
 import csv
 import json
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -185,26 +186,18 @@ def write_to_json(data: list[dict[str, Any]], output_path: str):
         json.dump(data, file, indent=2, ensure_ascii=False)
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Transform AliExpress scraper results to Listing table schema"
-    )
-    parser.add_argument("input_file", help="Input file path (CSV or JSON)")
-    parser.add_argument(
-        "-o",
-        "--output",
-        help="Output file path (default: auto-generated). Format is auto-detected from extension.",
-    )
-    parser.add_argument(
-        "-f",
-        "--format",
-        choices=["csv", "json"],
-        help="Output format (default: auto-detect from output file extension, fallback to csv)",
-    )
+@dataclass(slots=True)
+class TransformConfig:
+    """Typed options for a transform run (mirrors the CLI flags)."""
+
+    input_file: str
+    output: str | None = None
+    format: str | None = None
 
-    args = parser.parse_args()
 
-    input_path = Path(args.input_file)
+def run(config: TransformConfig) -> None:
+    """Transform a scraper output file according to an already-built config."""
+    input_path = Path(config.input_file)
 
     if not input_path.exists():
         print(f"Error: Input file '{input_path}' does not exist.")
@@ -213,22 +206,22 @@ def main():
     # Determine output format
     output_format = "csv"  # default fallback
 
-    if args.output:
+    if config.output:
         # Auto-detect format from output file extension
-        output_ext = Path(args.output).suffix.lower()
+        output_ext = Path(config.output).suffix.lower()
         if output_ext == ".json":
             output_format = "json"
         elif output_ext == ".csv":
             output_format = "csv"
-        elif args.format:
+        elif config.format:
             # Use explicit format if extension is not recognized
-            output_format = args.format
+            output_format = config.format
         else:
             # Default to csv if no extension and no format specified
             output_format = "csv"
-    elif args.format:
+    elif config.format:
         # Use explicit format when no output file specified
-        output_format = args.format
+        output_format = config.format
 
     # Determine input format from file extension
     if input_path.suffix.lower() == ".json":
@@ -250,8 +243,8 @@ def main():
     print(f"Transformed {len(transformed_data)} items")
 
     # Generate output filename if not provided
-    if args.output:
-        output_path = args.output
+    if config.output:
+        output_path = config.output
     else:
         output_path = input_path.stem + f"_listing_format.{output_format}"
 
@@ -284,5 +277,31 @@ def main():
     print("- Other fields: Set to appropriate defaults")
 
 
+def main():
+    parser = argparse.ArgumentParser(
+        description="Transform AliExpress scraper results to Listing table schema"
+    )
+    parser.add_argument("input_file", help="Input file path (CSV or JSON)")
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Output file path (default: auto-generated). Format is auto-detected from extension.",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["csv", "json"],
+        help="Output format (default: auto-detect from output file extension, fallback to csv)",
+    )
+
+    args = parser.parse_args()
+
+    run(
+        TransformConfig(
+            input_file=args.input_file, output=args.output, format=args.format
+        )
+    )
+
+
 if __name__ == "__main__":
     main()